@@ -24,7 +24,7 @@ mv "${INIT_PY}.tmp" "${INIT_PY}"
 
 echo "Installing dependencies..."
 "${PYTHON}" -m pip install \
-    requests PyYAML markdownify \
+    requests PyYAML \
     --target "${BUILD_DIR}" \
     --quiet
 
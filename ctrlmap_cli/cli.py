@@ -18,6 +18,8 @@ from ctrlmap_cli.exporters.vendors import VendorsExporter
 from ctrlmap_cli.models.config import AppConfig
 
 _SUBDIRS = ("govs", "pols", "pros", "risks", "vendors")
+# Stays below requests' default connection pool size of 10 per host.
+_DEFAULT_CONCURRENCY = 8
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -54,9 +56,23 @@ def _build_parser() -> argparse.ArgumentParser:
         "--keep-raw-json", action="store_true",
         help="Also write raw JSON files alongside Markdown.",
     )
+    parser.add_argument(
+        "--concurrency", type=_positive_int, default=_DEFAULT_CONCURRENCY, metavar="N",
+        help=f"Number of documents to fetch in parallel (default: {_DEFAULT_CONCURRENCY}).",
+    )
     return parser
 
 
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid positive integer: '{value}'") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def _run_init(api_url: str) -> None:
     if not api_url.startswith("https://"):
         raise ConfigError("API URL must start with https://")
@@ -96,6 +112,7 @@ def _run_export(args: argparse.Namespace) -> None:
     export_kwargs = {
         "force": args.force,
         "keep_raw_json": args.keep_raw_json,
+        "concurrency": args.concurrency,
     }
 
     # Single-item exports
@@ -2,14 +2,24 @@ from __future__ import annotations
 
 import re
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, Tuple, TypeVar
 
 import yaml
 
 from ctrlmap_cli.client import CtrlMapClient
 from ctrlmap_cli.formatters.json_formatter import JsonFormatter
 
+# libyaml's loader is not importable from inside the zipapp, so fall back to the
+# pure-Python one there.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_K = TypeVar("_K")
+_T = TypeVar("_T")
+
 
 class BaseExporter(ABC):
     def __init__(
@@ -19,11 +29,13 @@ class BaseExporter(ABC):
         *,
         force: bool = False,
         keep_raw_json: bool = False,
+        concurrency: int = 1,
     ) -> None:
         self.client = client
         self.output_dir = output_dir
         self.force = force
         self.keep_raw_json = keep_raw_json
+        self.concurrency = max(1, concurrency)
         self._overwrite_all = False
         self._json_formatter = JsonFormatter()
 
@@ -43,12 +55,42 @@ class BaseExporter(ABC):
     def _log(self, message: str) -> None:
         print(message)
 
+    def _fetch_in_order(self, fetch: Callable[[_K], _T], keys: Iterable[_K]) -> Iterator[_T]:
+        """Yield ``fetch(key)`` for every key in order, running up to ``concurrency`` fetches at once.
+
+        Results are handed back on the calling thread, so writing files and
+        prompting stay sequential. At most two fetches per worker are in
+        flight, which keeps memory bounded while the caller is busy.
+        """
+        if self.concurrency == 1:
+            for key in keys:
+                yield fetch(key)
+            return
+
+        remaining = iter(keys)
+        pool = ThreadPoolExecutor(max_workers=self.concurrency)
+        try:
+            pending: Deque[Future[_T]] = deque(
+                pool.submit(fetch, key) for key in islice(remaining, self.concurrency * 2)
+            )
+            while pending:
+                result = pending.popleft().result()
+                for key in islice(remaining, 1):
+                    pending.append(pool.submit(fetch, key))
+                yield result
+        except BaseException:
+            # Requests have no timeout, so on a failed fetch or Ctrl-C drop the
+            # queued fetches instead of waiting for everything in flight.
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        pool.shutdown()
+
     def _should_write(self, path: Path) -> bool:
         """Check whether *path* should be written, prompting if needed."""
-        if not path.exists():
-            return True
         if self.force or self._overwrite_all:
             return True
+        if not path.exists():
+            return True
         while True:
             answer = input(
                 f"Overwrite existing {path.name}? [Yes/No/All] "
@@ -119,6 +161,6 @@ class BaseExporter(ABC):
 
         yaml_text = text[4:end]
         try:
-            return yaml.safe_load(yaml_text)
+            return yaml.load(yaml_text, Loader=_YAML_LOADER)
         except yaml.YAMLError:
             return None
@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional
 
 from ctrlmap_cli.exceptions import ItemNotFoundError
 from ctrlmap_cli.exporters.base import BaseExporter
+from ctrlmap_cli.formatters.base import atomic_write
 from ctrlmap_cli.formatters.markdown_formatter import MarkdownFormatter
 from ctrlmap_cli.html_converter import decode_description, html_to_markdown
 from ctrlmap_cli.models.governance import GovernanceDocument
@@ -31,13 +32,8 @@ class GovernanceExporter(BaseExporter):
 
         documents: List[GovernanceDocument] = []
         codes: List[str] = []
-        for raw in raw_list:
-            doc_id = raw.get("id", 0)
-            detail = self.client.get(f"/procedure/{doc_id}")
-            controls_raw = self.client.get(f"/procedure/{doc_id}/controls")
-            requirements_raw = self.client.get(f"/procedure/{doc_id}/requirements")
-
-            doc = self._parse_document(detail, controls_raw, requirements_raw)
+        doc_ids = [raw.get("id", 0) for raw in raw_list]
+        for doc in self._fetch_in_order(self._fetch_document, doc_ids):
             file_stem = doc.code or f"GOV-{doc.id}"
             self._export_document(file_stem, doc)
             documents.append(doc)
@@ -70,18 +66,20 @@ class GovernanceExporter(BaseExporter):
                 "Check the code and try again."
             )
 
-        doc_id = match.get("id", 0)
-        detail = self.client.get(f"/procedure/{doc_id}")
-        controls_raw = self.client.get(f"/procedure/{doc_id}/controls")
-        requirements_raw = self.client.get(f"/procedure/{doc_id}/requirements")
-
-        doc = self._parse_document(detail, controls_raw, requirements_raw)
+        doc = self._fetch_document(match.get("id", 0))
         file_stem = doc.code or f"GOV-{doc.id}"
         self._export_document(file_stem, doc)
 
         self._rebuild_index(raw_list)
         self._log(f"Exporting governance... {file_stem} done")
 
+    def _fetch_document(self, doc_id: Any) -> GovernanceDocument:
+        """Fetch detail, controls and requirements for one document and parse them."""
+        detail = self.client.get(f"/procedure/{doc_id}")
+        controls_raw = self.client.get(f"/procedure/{doc_id}/controls")
+        requirements_raw = self.client.get(f"/procedure/{doc_id}/requirements")
+        return self._parse_document(detail, controls_raw, requirements_raw)
+
     def _rebuild_index(self, api_list: List[Dict[str, Any]]) -> None:
         """Rebuild index from API list + local frontmatter."""
         local_fm = self._read_local_frontmatter()
@@ -132,8 +130,7 @@ class GovernanceExporter(BaseExporter):
 
         index_path = self.output_dir / "index.md"
         if self._should_write(index_path):
-            with open(index_path, "w", encoding="utf-8") as f:
-                f.write(md_content)
+            atomic_write(index_path, md_content)
 
     def _parse_document(
         self,
@@ -144,18 +141,14 @@ class GovernanceExporter(BaseExporter):
         raw_id = detail.get("id", 0)
         item_id = raw_id if isinstance(raw_id, int) else 0
 
-        status_obj = detail.get("status")
-        status_name = status_obj.get("name", "") if isinstance(status_obj, dict) else ""
+        status_name = _nested_field(detail, "status", "name")
 
         major = detail.get("majorVersion", 0)
         minor = detail.get("minorVersion", 0)
         version = f"{major}.{minor}"
 
-        owner_obj = detail.get("owner")
-        owner = owner_obj.get("fullname", "") if isinstance(owner_obj, dict) else ""
-
-        approver_obj = detail.get("approver")
-        approver = approver_obj.get("fullname", "") if isinstance(approver_obj, dict) else ""
+        owner = _nested_field(detail, "owner", "fullname")
+        approver = _nested_field(detail, "approver", "fullname")
 
         contributors_raw_list = detail.get("contributors", [])
         contributors: List[str] = []
@@ -166,16 +159,14 @@ class GovernanceExporter(BaseExporter):
                     if name:
                         contributors.append(name)
 
-        classification = _extract_optional_str(detail, "classification", "dataClassification") or ""
-        properties = detail.get("properties")
-        if isinstance(properties, dict):
-            classification = classification or (
-                _extract_optional_str(properties, "classification", "dataClassification") or ""
-            )
-
+        classification = _extract_optional_str(detail, "classification", "dataClassification")
         review_date = _extract_optional_str(detail, "reviewDate", "nextReviewDate")
         updated = _extract_optional_str(detail, "updatedate", "updatedAt", "updateDate")
+        properties = detail.get("properties")
         if isinstance(properties, dict):
+            classification = classification or _extract_optional_str(
+                properties, "classification", "dataClassification",
+            )
             review_date = review_date or _extract_optional_str(properties, "reviewDate", "nextReviewDate")
             updated = updated or _extract_optional_str(properties, "updatedate", "updatedAt", "updateDate")
 
@@ -195,7 +186,7 @@ class GovernanceExporter(BaseExporter):
             owner=owner,
             approver=approver,
             contributors=contributors,
-            classification=classification,
+            classification=classification or "",
             review_date=review_date,
             updated=updated,
             controls=controls,
@@ -229,8 +220,7 @@ class GovernanceExporter(BaseExporter):
 
         md_path = self.output_dir / f"{file_stem}.md"
         if self._should_write(md_path):
-            with open(md_path, "w", encoding="utf-8") as f:
-                f.write(md_content)
+            atomic_write(md_path, md_content)
 
         if self.keep_raw_json:
             json_path = self.output_dir / f"{file_stem}.json"
@@ -266,8 +256,7 @@ class GovernanceExporter(BaseExporter):
 
         index_path = self.output_dir / "index.md"
         if self._should_write(index_path):
-            with open(index_path, "w", encoding="utf-8") as f:
-                f.write(md_content)
+            atomic_write(index_path, md_content)
 
 
 def _find_by_code(
@@ -280,6 +269,12 @@ def _find_by_code(
     return None
 
 
+def _nested_field(data: Dict[str, Any], key: str, field: str) -> str:
+    """Return ``data[key][field]``, or "" when *key* does not hold an object."""
+    obj = data.get(key)
+    return obj.get(field, "") if isinstance(obj, dict) else ""
+
+
 def _extract_optional_str(data: Dict[str, Any], *keys: str) -> Optional[str]:
     for key in keys:
         value = data.get(key)
@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional
 
 from ctrlmap_cli.exceptions import ItemNotFoundError
 from ctrlmap_cli.exporters.base import BaseExporter
+from ctrlmap_cli.formatters.base import atomic_write
 from ctrlmap_cli.formatters.markdown_formatter import MarkdownFormatter
 from ctrlmap_cli.html_converter import (
     decode_description,
@@ -24,10 +25,8 @@ class PoliciesExporter(BaseExporter):
 
         documents: List[PolicyDocument] = []
         codes: List[str] = []
-        for raw in raw_list:
-            doc_id = _as_int(raw.get("id", 0))
-            detail = self.client.get_policy(doc_id)
-
+        doc_ids = [_as_int(raw.get("id", 0)) for raw in raw_list]
+        for detail in self._fetch_in_order(self.client.get_policy, doc_ids):
             doc = self._parse_document(detail)
             file_stem = doc.code or f"POL-{doc.id}"
             self._export_document(file_stem, doc)
@@ -123,8 +122,7 @@ class PoliciesExporter(BaseExporter):
 
         index_path = self.output_dir / "index.md"
         if self._should_write(index_path):
-            with open(index_path, "w", encoding="utf-8") as f:
-                f.write(md_content)
+            atomic_write(index_path, md_content)
 
     def _parse_document(self, detail: Dict[str, Any]) -> PolicyDocument:
         raw_id = detail.get("id", 0)
@@ -250,8 +248,7 @@ class PoliciesExporter(BaseExporter):
 
         md_path = self.output_dir / f"{file_stem}.md"
         if self._should_write(md_path):
-            with open(md_path, "w", encoding="utf-8") as f:
-                f.write(md_content)
+            atomic_write(md_path, md_content)
 
         if self.keep_raw_json:
             json_path = self.output_dir / f"{file_stem}.json"
@@ -291,8 +288,7 @@ class PoliciesExporter(BaseExporter):
 
         index_path = self.output_dir / "index.md"
         if self._should_write(index_path):
-            with open(index_path, "w", encoding="utf-8") as f:
-                f.write(md_content)
+            atomic_write(index_path, md_content)
 
 
 def _find_by_code(
@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional
 
 from ctrlmap_cli.exceptions import ItemNotFoundError
 from ctrlmap_cli.exporters.base import BaseExporter
+from ctrlmap_cli.formatters.base import atomic_write
 from ctrlmap_cli.formatters.markdown_formatter import MarkdownFormatter
 from ctrlmap_cli.html_converter import decode_description, html_to_markdown
 from ctrlmap_cli.models.procedures import ProcedureDocument
@@ -20,13 +21,8 @@ class ProceduresExporter(BaseExporter):
 
         documents: List[ProcedureDocument] = []
         codes: List[str] = []
-        for raw in raw_list:
-            doc_id = _as_int(raw.get("id", 0))
-            detail = self.client.get_procedure(doc_id)
-            controls_raw = self.client.get_procedure_controls(doc_id)
-            requirements_raw = self.client.get_procedure_requirements(doc_id)
-
-            doc = self._parse_document(detail, controls_raw, requirements_raw)
+        doc_ids = [_as_int(raw.get("id", 0)) for raw in raw_list]
+        for doc in self._fetch_in_order(self._fetch_document, doc_ids):
             file_stem = doc.code or f"PRO-{doc.id}"
             self._export_document(file_stem, doc)
             documents.append(doc)
@@ -57,18 +53,20 @@ class ProceduresExporter(BaseExporter):
                 "Check the code and try again."
             )
 
-        doc_id = _as_int(match.get("id", 0))
-        detail = self.client.get_procedure(doc_id)
-        controls_raw = self.client.get_procedure_controls(doc_id)
-        requirements_raw = self.client.get_procedure_requirements(doc_id)
-
-        doc = self._parse_document(detail, controls_raw, requirements_raw)
+        doc = self._fetch_document(_as_int(match.get("id", 0)))
         file_stem = doc.code or f"PRO-{doc.id}"
         self._export_document(file_stem, doc)
 
         self._rebuild_index(raw_list)
         self._log(f"Exporting procedures... {file_stem} done")
 
+    def _fetch_document(self, doc_id: int) -> ProcedureDocument:
+        """Fetch detail, controls and requirements for one procedure and parse them."""
+        detail = self.client.get_procedure(doc_id)
+        controls_raw = self.client.get_procedure_controls(doc_id)
+        requirements_raw = self.client.get_procedure_requirements(doc_id)
+        return self._parse_document(detail, controls_raw, requirements_raw)
+
     def _rebuild_index(self, api_list: List[Dict[str, Any]]) -> None:
         """Rebuild index from API list + local frontmatter."""
         local_fm = self._read_local_frontmatter()
@@ -123,8 +121,7 @@ class ProceduresExporter(BaseExporter):
 
         index_path = self.output_dir / "index.md"
         if self._should_write(index_path):
-            with open(index_path, "w", encoding="utf-8") as f:
-                f.write(md_content)
+            atomic_write(index_path, md_content)
 
     def _parse_document(
         self,
@@ -216,8 +213,7 @@ class ProceduresExporter(BaseExporter):
 
         md_path = self.output_dir / f"{file_stem}.md"
         if self._should_write(md_path):
-            with open(md_path, "w", encoding="utf-8") as f:
-                f.write(md_content)
+            atomic_write(md_path, md_content)
 
         if self.keep_raw_json:
             json_path = self.output_dir / f"{file_stem}.json"
@@ -257,8 +253,7 @@ class ProceduresExporter(BaseExporter):
 
         index_path = self.output_dir / "index.md"
         if self._should_write(index_path):
-            with open(index_path, "w", encoding="utf-8") as f:
-                f.write(md_content)
+            atomic_write(index_path, md_content)
 
 
 def _find_by_code(
@@ -7,6 +7,7 @@ from typing import Any, Dict, List
 
 from ctrlmap_cli.exceptions import ItemNotFoundError
 from ctrlmap_cli.exporters.base import BaseExporter
+from ctrlmap_cli.formatters.base import atomic_write
 from ctrlmap_cli.formatters.markdown_formatter import MarkdownFormatter
 from ctrlmap_cli.models.risks import (
     LossAnalysisArea,
@@ -40,12 +41,8 @@ class RisksExporter(BaseExporter):
 
         documents: List[RiskDocument] = []
         codes: List[str] = []
-        for raw in raw_list:
-            doc_id = _as_int(raw.get("id", 0))
-            detail = self.client.get_risk(doc_id)
-            areas_raw = self.client.get_risk_areas(doc_id)
-
-            doc = self._parse_document(detail, areas_raw)
+        doc_ids = [_as_int(raw.get("id", 0)) for raw in raw_list]
+        for doc in self._fetch_in_order(self._fetch_document, doc_ids):
             file_stem = doc.code or f"RSK-{doc.id}"
             self._export_document(file_stem, doc)
             documents.append(doc)
@@ -101,6 +98,12 @@ class RisksExporter(BaseExporter):
         self._rebuild_index(raw_list)
         self._log(f"Exporting risks... {file_stem} done")
 
+    def _fetch_document(self, doc_id: int) -> RiskDocument:
+        """Fetch detail and loss areas for one risk and parse them."""
+        detail = self.client.get_risk(doc_id)
+        areas_raw = self.client.get_risk_areas(doc_id)
+        return self._parse_document(detail, areas_raw)
+
     def _rebuild_index(self, api_list: List[Dict[str, Any]]) -> None:
         """Rebuild index from API list + local frontmatter.
 
@@ -163,8 +166,7 @@ class RisksExporter(BaseExporter):
 
         index_path = self.output_dir / "index.md"
         if self._should_write(index_path):
-            with open(index_path, "w", encoding="utf-8") as f:
-                f.write(md_content)
+            atomic_write(index_path, md_content)
 
     def _parse_document(
         self,
@@ -263,8 +265,7 @@ class RisksExporter(BaseExporter):
 
         md_path = self.output_dir / f"{file_stem}.md"
         if self._should_write(md_path):
-            with open(md_path, "w", encoding="utf-8") as f:
-                f.write(md_content)
+            atomic_write(md_path, md_content)
 
         if self.keep_raw_json:
             json_path = self.output_dir / f"{file_stem}.json"
@@ -305,8 +306,7 @@ class RisksExporter(BaseExporter):
 
         index_path = self.output_dir / "index.md"
         if self._should_write(index_path):
-            with open(index_path, "w", encoding="utf-8") as f:
-                f.write(md_content)
+            atomic_write(index_path, md_content)
 
 
 def _parse_score(data: Any) -> RiskScore:
@@ -9,6 +9,7 @@ from typing import Any, Dict, List, Optional, Set
 
 from ctrlmap_cli.exceptions import ItemNotFoundError
 from ctrlmap_cli.exporters.base import BaseExporter
+from ctrlmap_cli.formatters.base import atomic_write
 from ctrlmap_cli.formatters.markdown_formatter import MarkdownFormatter
 from ctrlmap_cli.models.vendors import (
     QuickAssessmentQuestion,
@@ -40,6 +41,9 @@ _MARKDOWN_PATTERN = re.compile(
     r"|(?:```)"             # code fences
     r"|(?:\[.+?\]\(.+?\))"  # links
 )
+_SLUG_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x1f\x7f]+")
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^A-Za-z0-9._-]+")
 
 
 def _looks_like_markdown(text: str) -> bool:
@@ -50,7 +54,7 @@ def _looks_like_markdown(text: str) -> bool:
 def _slugify(name: str) -> str:
     """Convert a vendor name to a filesystem-safe slug."""
     slug = name.lower()
-    slug = re.sub(r"[^a-z0-9]+", "-", slug)
+    slug = _SLUG_SEPARATOR_RE.sub("-", slug)
     slug = slug.strip("-")[:_MAX_SLUG_LENGTH].rstrip("-")
     return slug
 
@@ -103,8 +107,8 @@ def _truncate_filename(filename: str) -> str:
 def _sanitize_attachment_filename(filename: str, index: int) -> str:
     normalized = filename.replace("\\", "/")
     basename = normalized.split("/")[-1]
-    basename = re.sub(r"[\x00-\x1f\x7f]+", "", basename).strip()
-    basename = re.sub(r"[^A-Za-z0-9._-]+", "-", basename).strip(".-")
+    basename = _CONTROL_CHARS_RE.sub("", basename).strip()
+    basename = _UNSAFE_FILENAME_CHARS_RE.sub("-", basename).strip(".-")
     if not basename:
         basename = f"attachment-{index}.bin"
     return _truncate_filename(basename)
@@ -206,21 +210,8 @@ class VendorsExporter(BaseExporter):
 
         documents: List[VendorDocument] = []
         codes: List[str] = []
-        for raw in raw_list:
-            vendor_id = _as_int(raw.get("id", 0))
-            if not vendor_id:
-                continue
-
-            detail = self.client.get_vendor(vendor_id)
-            risks_raw = self.client.get_vendor_risks(vendor_id)
-            hyperlinks_raw = self.client.get_vendor_hyperlinks(vendor_id)
-            contacts_raw = self.client.get_vendor_contacts(vendor_id)
-
-            quick_assessment_raw = self._fetch_quick_assessment(detail)
-
-            doc = self._parse_document(
-                detail, risks_raw, hyperlinks_raw, contacts_raw, quick_assessment_raw,
-            )
+        vendor_ids = [_as_int(raw.get("id", 0)) for raw in raw_list]
+        for doc in self._fetch_in_order(self._fetch_document, [vid for vid in vendor_ids if vid]):
             code_number = doc.code.replace("VND-", "") if doc.code.startswith("VND-") else str(doc.id)
             file_stem = f"VND-{code_number}"
             self._export_document(file_stem, doc)
@@ -288,6 +279,17 @@ class VendorsExporter(BaseExporter):
         self._rebuild_index(raw_list)
         self._log(f"Exporting vendors... {file_stem} done")
 
+    def _fetch_document(self, vendor_id: int) -> VendorDocument:
+        """Fetch detail, risks, links, contacts and quick assessment for one vendor and parse them."""
+        detail = self.client.get_vendor(vendor_id)
+        risks_raw = self.client.get_vendor_risks(vendor_id)
+        hyperlinks_raw = self.client.get_vendor_hyperlinks(vendor_id)
+        contacts_raw = self.client.get_vendor_contacts(vendor_id)
+        quick_assessment_raw = self._fetch_quick_assessment(detail)
+        return self._parse_document(
+            detail, risks_raw, hyperlinks_raw, contacts_raw, quick_assessment_raw,
+        )
+
     def _rebuild_index(self, api_list: List[Dict[str, Any]]) -> None:
         """Rebuild index from API list + local frontmatter.
 
@@ -341,8 +343,7 @@ class VendorsExporter(BaseExporter):
 
         index_path = self.output_dir / "index.md"
         if self._should_write(index_path):
-            with open(index_path, "w", encoding="utf-8") as f:
-                f.write(md_content)
+            atomic_write(index_path, md_content)
 
     def _fetch_quick_assessment(self, detail: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         assessment_id = _as_int(detail.get("vendorQuickAssessmentId"))
@@ -547,8 +548,7 @@ class VendorsExporter(BaseExporter):
 
         md_path = self.output_dir / f"{file_stem}.md"
         if self._should_write(md_path):
-            with open(md_path, "w", encoding="utf-8") as f:
-                f.write(md_content)
+            atomic_write(md_path, md_content)
 
         if self.keep_raw_json:
             json_path = self.output_dir / f"{file_stem}.json"
@@ -573,8 +573,7 @@ class VendorsExporter(BaseExporter):
                 continue
             try:
                 data = self.client.download_file(attachment.signed_url)
-                with open(file_path, "wb") as f:
-                    f.write(data)
+                atomic_write(file_path, data)
                 self._log(f"  Downloaded {output_name}")
             except Exception:
                 self._log(f"  Warning: failed to download {output_name}")
@@ -619,8 +618,7 @@ class VendorsExporter(BaseExporter):
 
         index_path = self.output_dir / "index.md"
         if self._should_write(index_path):
-            with open(index_path, "w", encoding="utf-8") as f:
-                f.write(md_content)
+            atomic_write(index_path, md_content)
 
 
 def _build_frontmatter(doc: VendorDocument, file_stem: str) -> Dict[str, Any]:
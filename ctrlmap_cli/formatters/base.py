@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import os
+import stat
+import uuid
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional, Union
+
+# O_BINARY keeps Windows from translating the already-converted newlines again.
+_TEMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
 
 
 class BaseFormatter(ABC):
@@ -13,3 +19,35 @@ class BaseFormatter(ABC):
     @abstractmethod
     def file_extension(self) -> str:
         ...
+
+
+def atomic_write(path: Path, content: Union[str, bytes]) -> None:
+    """Write *content* to a hidden sibling of *path*, then rename it into place.
+
+    An interrupted export leaves either the previous file or the new one,
+    never a truncated one. Text is written as UTF-8 with platform newlines.
+    A symlinked *path* updates the file it points to, and an existing file
+    keeps its permissions. There is deliberately no fsync: this guards
+    against partial writes, not against power loss.
+    """
+    if isinstance(content, str):
+        # Encoding up front lets the whole file go out in one binary write.
+        if os.linesep != "\n":
+            content = content.replace("\n", os.linesep)
+        content = content.encode("utf-8")
+    path = Path(os.path.realpath(path))
+    try:
+        mode: Optional[int] = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = None
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    fd = os.open(tmp_path, _TEMP_FLAGS, 0o666)
+    try:
+        with open(fd, "wb") as binary_file:
+            binary_file.write(content)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -5,14 +5,12 @@ from pathlib import Path
 from typing import Any
 
 
-from ctrlmap_cli.formatters.base import BaseFormatter
+from ctrlmap_cli.formatters.base import BaseFormatter, atomic_write
 
 
 class JsonFormatter(BaseFormatter):
     def write(self, data: Any, output_path: Path) -> None:
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.write("\n")
+        atomic_write(output_path, json.dumps(data, indent=2, ensure_ascii=False) + "\n")
 
     def file_extension(self) -> str:
         return ".json"
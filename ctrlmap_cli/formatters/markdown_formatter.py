@@ -2,21 +2,37 @@ from __future__ import annotations
 
 from dataclasses import asdict, is_dataclass
 from pathlib import Path
+import re
 import textwrap
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import yaml
 
-from ctrlmap_cli.formatters.base import BaseFormatter
+from ctrlmap_cli.formatters.base import BaseFormatter, atomic_write
+
+# PyYAML folds scalars that run past this column; such lines go through yaml.dump.
+_YAML_WIDTH = 80
+_YAML_STR_TAG = "tag:yaml.org,2002:str"
+_YAML_RESOLVER = yaml.resolver.Resolver()
+# Characters PyYAML writes verbatim (allow_unicode=True), excluding line breaks.
+_YAML_PRINTABLE_RE = re.compile(
+    "[\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufefe\uff00-\ufffd\U00010000-\U0010fffe]*"
+)
+_YAML_LEADING_INDICATORS = frozenset("#,[]{}&*!|>'\"%@`")
+# Lines textwrap treats specially (other whitespace, runs of spaces, edge spaces).
+_TEXTWRAP_SLOW_PATH_RE = re.compile(r"[^\S ]|  |^ | $")
 
 
 class MarkdownFormatter(BaseFormatter):
     _MAX_LINE_LENGTH = 120
+    _WRAPPER = textwrap.TextWrapper(
+        width=_MAX_LINE_LENGTH,
+        break_long_words=False,
+        break_on_hyphens=False,
+    )
 
     def write(self, data: Any, output_path: Path) -> None:
-        content = self._render_data(data)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        atomic_write(output_path, self._render_data(data))
 
     def file_extension(self) -> str:
         return ".md"
@@ -30,12 +46,14 @@ class MarkdownFormatter(BaseFormatter):
     ) -> str:
         parts = []
         if frontmatter:
-            fm_text = yaml.dump(
-                frontmatter,
-                default_flow_style=False,
-                allow_unicode=True,
-                sort_keys=False,
-            ).rstrip("\n")
+            fm_text = _emit_frontmatter(frontmatter)
+            if fm_text is None:
+                fm_text = yaml.dump(
+                    frontmatter,
+                    default_flow_style=False,
+                    allow_unicode=True,
+                    sort_keys=False,
+                ).rstrip("\n")
             parts.append(f"---\n{fm_text}\n---\n")
         if title:
             parts.append(f"# {title}\n")
@@ -73,19 +91,17 @@ class MarkdownFormatter(BaseFormatter):
 
     @classmethod
     def _wrap_body(cls, body: str) -> str:
-        wrapped_lines = []
+        wrapped_lines: List[str] = []
+        in_fence = False
         for line in body.splitlines():
-            if cls._should_preserve_line(line):
+            if line.lstrip().startswith("```"):
+                in_fence = not in_fence
+            if in_fence or cls._should_preserve_line(line):
                 wrapped_lines.append(line)
-                continue
-            wrapped_lines.append(
-                textwrap.fill(
-                    line,
-                    width=cls._MAX_LINE_LENGTH,
-                    break_long_words=False,
-                    break_on_hyphens=False,
-                )
-            )
+            elif _TEXTWRAP_SLOW_PATH_RE.search(line):
+                wrapped_lines.append(cls._WRAPPER.fill(line))
+            else:
+                _wrap_words(wrapped_lines, line, cls._MAX_LINE_LENGTH)
         return "\n".join(wrapped_lines)
 
     @classmethod
@@ -99,3 +115,96 @@ class MarkdownFormatter(BaseFormatter):
         if "`" in line or "](" in line or "**" in line:
             return True
         return False
+
+
+def _wrap_words(lines: List[str], text: str, width: int) -> None:
+    """Greedily wrap words separated by single spaces, like ``textwrap.fill``.
+
+    Breaks at the last space within *width*; a word longer than *width* gets
+    a line of its own rather than being split.
+    """
+    start = 0
+    while len(text) - start > width:
+        end = text.rfind(" ", start, start + width + 1)
+        if end == -1:
+            end = text.find(" ", start + width)
+            if end == -1:
+                break
+        lines.append(text[start:end])
+        start = end + 1
+    lines.append(text[start:])
+
+
+def _emit_frontmatter(frontmatter: Dict[str, Any]) -> Optional[str]:
+    """Write *frontmatter* exactly as ``yaml.dump`` would, without building a node graph.
+
+    Covers the shapes the exporters produce: scalars, lists of scalars and
+    one level of nested mappings. Returns ``None`` for anything else, or for
+    scalars PyYAML would double-quote or fold, so the caller can fall back.
+    """
+    lines: List[str] = []
+    for key, value in frontmatter.items():
+        key_text = _yaml_key(key)
+        if key_text is None:
+            return None
+        if isinstance(value, dict):
+            if not value:
+                lines.append(f"{key_text}: {{}}")
+                continue
+            lines.append(f"{key_text}:")
+            for sub_key, sub_value in value.items():
+                sub_key_text = _yaml_key(sub_key)
+                if sub_key_text is None or not _append_scalar(lines, f"  {sub_key_text}: ", sub_value):
+                    return None
+        elif isinstance(value, list):
+            if not value:
+                lines.append(f"{key_text}: []")
+                continue
+            lines.append(f"{key_text}:")
+            for item in value:
+                if not _append_scalar(lines, "- ", item):
+                    return None
+        elif not _append_scalar(lines, f"{key_text}: ", value):
+            return None
+    return "\n".join(lines)
+
+
+def _append_scalar(lines: List[str], prefix: str, value: Any) -> bool:
+    text = _yaml_scalar(value)
+    if text is None or len(prefix) + len(text) > _YAML_WIDTH:
+        return False
+    lines.append(prefix + text)
+    return True
+
+
+def _yaml_key(key: Any) -> Optional[str]:
+    if type(key) is str and _YAML_PRINTABLE_RE.fullmatch(key) and _is_plain(key):
+        return key
+    return None
+
+
+def _yaml_scalar(value: Any) -> Optional[str]:
+    if value is None:
+        return "null"
+    if type(value) is bool:
+        return "true" if value else "false"
+    if type(value) is int:
+        return str(value)
+    if type(value) is not str or not _YAML_PRINTABLE_RE.fullmatch(value):
+        return None
+    if _is_plain(value):
+        return value
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _is_plain(value: str) -> bool:
+    """Whether PyYAML emits the printable, single-line *value* unquoted."""
+    if not value or value[0] == " " or value[-1] == " ":
+        return False
+    if value.startswith(("---", "...")) or value[0] in _YAML_LEADING_INDICATORS:
+        return False
+    if value[0] in "?:-" and value[1:2] in ("", " "):
+        return False
+    if ": " in value or value.endswith(":") or " #" in value:
+        return False
+    return _YAML_RESOLVER.resolve(yaml.ScalarNode, value, (True, False)) == _YAML_STR_TAG
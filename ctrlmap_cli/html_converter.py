@@ -1,53 +1,404 @@
 from __future__ import annotations
 
+import binascii
+import functools
 import re
 import textwrap
+from html.parser import HTMLParser
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import unquote
 
-import markdownify
-
 _MAX_LINE_LENGTH = 120
+# Inputs above this size bypass the conversion cache to bound its memory.
+_CACHE_MAX_INPUT_LENGTH = 64 * 1024
 
 # Pattern: <strong>&nbsp;</strong> or <b>&nbsp;</b> or <strong> </strong>
 # ControlMap editor inserts these as word separators.
-_BOLD_NBSP_RE = re.compile(r"<(strong|b)>\s*(&nbsp;|\s)\s*</\1>", re.IGNORECASE)
+_BOLD_NBSP_RE = re.compile(r"<(strong|b)>(?:\s|&nbsp;|&#160;|&#x[aA]0;)+</\1>", re.IGNORECASE)
 _TABLE_BREAK_MARKER = "\x01"
 _TABLE_NO_BREAK_MARKER = "\x02"
+_TABLE_MARKERS = frozenset((_TABLE_BREAK_MARKER, _TABLE_NO_BREAK_MARKER))
+
+# A "%" not followed by two hex digits; unquote keeps these verbatim.
+_MALFORMED_ESCAPE_RE = re.compile(rb"%(?![0-9A-Fa-f]{2})")
+_PERCENT_TO_EQUALS = bytes.maketrans(b"%", b"=")
 
 
 def decode_description(encoded: str) -> str:
     """Double URL-decode the ControlMap description field."""
     if not encoded:
         return ""
+    if "%" not in encoded:
+        return encoded
+    if encoded.isascii():
+        once = _percent_decode(encoded.encode("ascii"))
+        if once is not None:
+            if b"%" not in once:
+                # Single-encoded input: the second unquote would be a no-op.
+                return once.decode("utf-8", "replace")
+            twice = _percent_decode(once)
+            if twice is not None:
+                return twice.decode("utf-8", "replace")
     return unquote(unquote(encoded))
 
 
+def _percent_decode(data: bytes) -> Optional[bytes]:
+    """Percent-decode *data* in C via the quoted-printable decoder.
+
+    With every ``%`` turned into ``=``, ``binascii.a2b_qp`` decodes ``=XX``
+    escapes exactly like ``unquote_to_bytes`` decodes ``%XX``. Input it would
+    read differently (non-ASCII, a literal ``=``, line breaks that look like
+    soft breaks, malformed escapes) returns ``None`` so the caller can fall
+    back to ``unquote``.
+    """
+    if (
+        not data.isascii()
+        or b"=" in data
+        or b"\n" in data
+        or b"\r" in data
+        or _MALFORMED_ESCAPE_RE.search(data)
+    ):
+        return None
+    return binascii.a2b_qp(data.translate(_PERCENT_TO_EQUALS))
+
+
 def html_to_markdown(html: str) -> str:
-    """Convert HTML to Markdown, cleaning up artifacts."""
+    """Convert HTML to Markdown, cleaning up artifacts.
+
+    Results are memoized so boilerplate repeated across a bulk export is
+    converted only once.
+    """
     if not html:
         return ""
-    html = _preprocess_html(html)
-    md: str = markdownify.markdownify(html, heading_style="ATX")
+    if len(html) > _CACHE_MAX_INPUT_LENGTH:
+        return _convert_html(html)
+    return _convert_html_cached(html)
+
+
+def _convert_html(html: str) -> str:
+    if "<" in html or "&" in html:
+        parser = _MarkdownConverter()
+        parser.feed(_preprocess_html(html))
+        md = parser.result()
+    else:
+        # Plain text: all the parser would do is collapse whitespace and escape emphasis.
+        md = _WHITESPACE_RE.sub(" ", _NEWLINE_WHITESPACE_RE.sub("\n", html))
+        md = md.replace("*", r"\*").replace("_", r"\_")
     md = md.replace("\u00ad", "")
     md = md.replace("\u00a0", " ")
     md = md.replace("&nbsp;", " ")
-    md = _convert_markdown_tables_to_lists(md)
-    md = _wrap_markdown(md)
-    md = "\n".join(line.rstrip() for line in md.splitlines())
-    md = _apply_table_linebreak_markers(md)
-    while "\n\n\n" in md:
-        md = md.replace("\n\n\n", "\n\n")
-    return md.strip()
+    lines = _convert_markdown_tables_to_lists(md.splitlines())
+    lines = _wrap_markdown(lines)
+    return "\n".join(_apply_table_linebreak_markers(lines)).strip()
+
+
+_convert_html_cached = functools.lru_cache(maxsize=4096)(_convert_html)
 
 
 def _preprocess_html(html: str) -> str:
-    """Clean HTML before markdownify conversion."""
+    """Clean HTML before conversion."""
     return _BOLD_NBSP_RE.sub(" ", html)
 
 
-def _convert_markdown_tables_to_lists(md: str) -> str:
-    lines = md.splitlines()
-    output = []
+# Elements whose leading/trailing whitespace is insignificant.
+_BLOCK_TAGS = frozenset({
+    "h1", "h2", "h3", "h4", "h5", "h6", "p", "blockquote", "ol", "ul", "li",
+    "table", "thead", "tbody", "tfoot", "tr", "td", "th",
+})
+# Elements that swallow whitespace-only text next to them.
+_BLOCK_OUTSIDE_TAGS = _BLOCK_TAGS | {"pre"}
+_VOID_TAGS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr",
+})
+_CODE_TAGS = frozenset({"pre", "code", "kbd", "samp"})
+_INLINE_MARKUP = {
+    "b": "**", "strong": "**", "em": "*", "i": "*", "del": "~~", "s": "~~",
+    "code": "`", "kbd": "`", "samp": "`", "sub": "", "sup": "",
+}
+_HEADING_TAGS = {"h1": "#", "h2": "##", "h3": "###", "h4": "####", "h5": "#####", "h6": "######"}
+_LIST_BULLETS = "*+-"
+
+_WHITESPACE_RE = re.compile(r"[\t ]+")
+_ALL_WHITESPACE_RE = re.compile(r"[\t \r\n]+")
+_NEWLINE_WHITESPACE_RE = re.compile(r"[\t \r\n]*[\r\n][\t \r\n]*")
+_LINE_BEGINNING_RE = re.compile(r"^", re.MULTILINE)
+
+_COMMENT = "!--"
+
+# A child node: (tag or None for text, rendered text, suffix added when followed by a sibling).
+# Comments render to nothing but still count as siblings for whitespace handling.
+_Node = Tuple[Optional[str], str, str]
+
+
+class _Element:
+    """An open element collecting its rendered children."""
+
+    __slots__ = ("tag", "attrs", "inline", "children", "first", "cells", "colspan", "all_th", "has_thead")
+
+    def __init__(self, tag: str, attrs: Dict[str, str], inline: bool, first: bool) -> None:
+        self.tag = tag
+        self.attrs = attrs
+        self.inline = inline
+        self.children: List[_Node] = []
+        self.first = first
+        self.cells = 0
+        self.colspan = 0
+        self.all_th = True
+        self.has_thead = False
+
+    @property
+    def children_inline(self) -> bool:
+        return self.inline or self.tag in _HEADING_TAGS or self.tag in ("td", "th")
+
+
+class _MarkdownConverter(HTMLParser):
+    """Convert the HTML subset produced by the ControlMap editor to Markdown.
+
+    Elements are rendered bottom-up as they close, so no document tree is
+    kept.  Whitespace handling and escaping follow markdownify's rules with
+    ATX headings, which earlier exports were produced with.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self._stack: List[_Element] = [_Element("", {}, inline=False, first=True)]
+        self._pre_depth = 0
+        self._code_depth = 0
+
+    def result(self) -> str:
+        self.close()
+        while len(self._stack) > 1:
+            self._close_element()
+        return self._render_children(self._stack[0])
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        parent = self._stack[-1]
+        # Only table rows and bodies care whether they open their parent.
+        first = tag in ("tr", "tbody") and not any(node[0] is not None or node[1].strip() for node in parent.children)
+        element = _Element(tag, {k: v or "" for k, v in attrs}, parent.children_inline, first)
+        if tag in ("td", "th"):
+            row = self._find_open("tr")
+            if row is not None:
+                row.cells += 1
+                colspan = element.attrs.get("colspan", "")
+                row.colspan += int(colspan) if colspan.isdigit() else 1
+                row.all_th = row.all_th and tag == "th"
+        elif tag == "thead":
+            table = self._find_open("table")
+            if table is not None:
+                table.has_thead = True
+        self._stack.append(element)
+        if tag == "pre":
+            self._pre_depth += 1
+        if tag in _CODE_TAGS:
+            self._code_depth += 1
+        if tag in _VOID_TAGS:
+            self._close_element()
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_TAGS:
+            self._close_element()
+
+    def handle_endtag(self, tag: str) -> None:
+        for depth in range(len(self._stack) - 1, 0, -1):
+            if self._stack[depth].tag == tag:
+                while len(self._stack) > depth:
+                    self._close_element()
+                return
+
+    def handle_data(self, data: str) -> None:
+        children = self._stack[-1].children
+        if children and children[-1][0] is None:
+            children[-1] = (None, children[-1][1] + data, "")
+        else:
+            children.append((None, data, ""))
+
+    def handle_comment(self, data: str) -> None:
+        self._stack[-1].children.append((_COMMENT, "", ""))
+
+    def _find_open(self, tag: str) -> Optional[_Element]:
+        for element in reversed(self._stack):
+            if element.tag == tag:
+                return element
+        return None
+
+    def _close_element(self) -> None:
+        element = self._stack[-1]
+        text = self._render_children(element)
+        self._stack.pop()
+        if element.tag == "pre":
+            self._pre_depth -= 1
+        if element.tag in _CODE_TAGS:
+            self._code_depth -= 1
+        converted, suffix = self._convert(element, text)
+        self._stack[-1].children.append((element.tag, converted, suffix))
+
+    def _render_children(self, element: _Element) -> str:
+        block = element.tag in _BLOCK_TAGS
+        nodes = element.children
+        count = len(nodes)
+        kept: List[_Node] = []
+        for idx, node in enumerate(nodes):
+            if node[0] is None and not node[1].strip():
+                prev_tag = nodes[idx - 1][0] if idx > 0 else None
+                next_tag = nodes[idx + 1][0] if idx + 1 < count else None
+                if (
+                    (block and (idx == 0 or idx == count - 1))
+                    or prev_tag in _BLOCK_OUTSIDE_TAGS
+                    or next_tag in _BLOCK_OUTSIDE_TAGS
+                ):
+                    continue
+            kept.append(node)
+
+        text = ""
+        count = len(kept)
+        for idx, (tag, value, suffix) in enumerate(kept):
+            if tag is None:
+                text += self._process_text(value, kept, idx, block)
+                continue
+            if tag == _COMMENT:
+                continue
+            if suffix and idx + 1 < count and kept[idx + 1][0] not in ("ul", "ol"):
+                value += suffix
+            text_strip = text.rstrip("\n")
+            value_strip = value.lstrip("\n")
+            newlines = max(len(text) - len(text_strip), len(value) - len(value_strip))
+            text = text_strip + "\n" * newlines + value_strip
+        return text
+
+    def _process_text(self, text: str, nodes: List[_Node], idx: int, block: bool) -> str:
+        if not self._pre_depth:
+            text = _NEWLINE_WHITESPACE_RE.sub("\n", text)
+            text = _WHITESPACE_RE.sub(" ", text)
+        if not self._code_depth:
+            text = text.replace("*", r"\*").replace("_", r"\_")
+        prev_tag = nodes[idx - 1][0] if idx > 0 else None
+        next_tag = nodes[idx + 1][0] if idx + 1 < len(nodes) else None
+        if prev_tag in _BLOCK_OUTSIDE_TAGS or (block and idx == 0):
+            text = text.lstrip()
+        if next_tag in _BLOCK_OUTSIDE_TAGS or (block and idx == len(nodes) - 1):
+            text = text.rstrip()
+        return text
+
+    def _convert(self, element: _Element, text: str) -> Tuple[str, str]:
+        tag = element.tag
+        inline = element.inline
+        if tag in _INLINE_MARKUP:
+            if tag == "code" and self._stack[-1].tag == "pre":
+                return text, ""
+            return _inline_markup(_INLINE_MARKUP[tag], text, self._code_depth > 0), ""
+        if tag in _HEADING_TAGS:
+            if inline:
+                return text, ""
+            text = _ALL_WHITESPACE_RE.sub(" ", text.strip())
+            return "\n%s %s\n\n" % (_HEADING_TAGS[tag], text), ""
+        if tag == "p":
+            if inline:
+                return " " + text.strip() + " ", ""
+            return ("\n\n%s\n\n" % text if text else ""), ""
+        if tag == "br":
+            return ("" if inline else "  \n"), ""
+        if tag in ("ul", "ol"):
+            if self._find_open("li") is not None:
+                return "\n" + text.rstrip(), ""
+            return "\n\n" + text, "\n"
+        if tag == "li":
+            return self._convert_li(text), ""
+        if tag == "a":
+            return _convert_link(element.attrs, text), ""
+        if tag in ("td", "th"):
+            colspan = element.attrs.get("colspan", "")
+            return " " + text.strip().replace("\n", " ") + " |" * (int(colspan) if colspan.isdigit() else 1), ""
+        if tag == "tr":
+            return self._convert_tr(element, text), ""
+        if tag == "table":
+            return "\n\n" + text + "\n", ""
+        if tag == "blockquote":
+            if inline:
+                return " " + text.strip() + " ", ""
+            return ("\n" + _LINE_BEGINNING_RE.sub("> ", text.strip()) + "\n\n" if text else ""), ""
+        if tag == "pre":
+            return ("\n```\n%s\n```\n" % text if text else ""), ""
+        if tag == "hr":
+            return "\n\n---\n\n", ""
+        if tag == "img":
+            alt = element.attrs.get("alt", "")
+            if inline:
+                return alt, ""
+            title = element.attrs.get("title", "")
+            title_part = ' "%s"' % title.replace('"', r'\"') if title else ""
+            return "![%s](%s%s)" % (alt, element.attrs.get("src", ""), title_part), ""
+        if tag == "caption":
+            return text + "\n", ""
+        if tag == "figcaption":
+            return "\n\n" + text + "\n\n", ""
+        if tag in ("script", "style"):
+            return "", ""
+        return text, ""
+
+    def _convert_li(self, text: str) -> str:
+        parent = self._stack[-1]
+        if parent.tag == "ol":
+            start = parent.attrs.get("start", "")
+            index = sum(1 for node in parent.children if node[0] is not None or node[1].strip())
+            bullet = "%d." % ((int(start) if start.isnumeric() else 1) + index)
+        else:
+            depth = sum(1 for element in self._stack if element.tag == "ul") - 1
+            bullet = _LIST_BULLETS[depth % len(_LIST_BULLETS)]
+        bullet += " "
+        text = text.strip()
+        if text:
+            text = _LINE_BEGINNING_RE.sub(" " * len(bullet), text)
+            text = bullet + text[len(bullet):]
+        return text + "\n"
+
+    def _convert_tr(self, row: _Element, text: str) -> str:
+        parent = self._stack[-1]
+        table = self._find_open("table")
+        is_headrow = row.all_th or (
+            row.first and (parent.tag != "tbody" or table is None or not table.has_thead)
+        )
+        overline = ""
+        underline = ""
+        if is_headrow and row.first:
+            underline = "| " + " | ".join(["---"] * row.colspan) + " |\n"
+        elif row.first and (parent.tag == "table" or (parent.tag == "tbody" and parent.first)):
+            overline = "| " + " | ".join([""] * row.cells) + " |\n"
+            overline += "| " + " | ".join(["---"] * row.cells) + " |\n"
+        return overline + "|" + text + "\n" + underline
+
+
+def _chomp(text: str) -> Tuple[str, str, str]:
+    """Move a leading/trailing space outside of inline markup."""
+    prefix = " " if text and text[0] == " " else ""
+    suffix = " " if text and text[-1] == " " else ""
+    return prefix, suffix, text.strip()
+
+
+def _inline_markup(markup: str, text: str, in_code: bool) -> str:
+    if in_code:
+        return text
+    prefix, suffix, text = _chomp(text)
+    if not text:
+        return ""
+    return prefix + markup + text + markup + suffix
+
+
+def _convert_link(attrs: Dict[str, str], text: str) -> str:
+    prefix, suffix, text = _chomp(text)
+    if not text:
+        return ""
+    href = attrs.get("href", "")
+    title = attrs.get("title", "")
+    if text.replace(r"\_", "_") == href and not title:
+        return "<%s>" % href
+    title_part = ' "%s"' % title.replace('"', r'\"') if title else ""
+    return "%s[%s](%s%s)%s" % (prefix, text, href, title_part, suffix) if href else text
+
+
+def _convert_markdown_tables_to_lists(lines: List[str]) -> List[str]:
+    output: List[str] = []
     idx = 0
 
     while idx < len(lines):
@@ -69,16 +420,19 @@ def _convert_markdown_tables_to_lists(md: str) -> str:
         output.append(line)
         idx += 1
 
-    return "\n".join(output)
+    return output
 
 
 def _looks_like_table_row(line: str) -> bool:
-    return "|" in line and len(_split_table_row(line)) > 0
+    # Splitting always yields at least one cell, so any pipe makes a row.
+    return "|" in line
+
+
+_TABLE_SEPARATOR_RE = re.compile(r"\|?[\s:\-]+\|[\s:\-\|]*")
 
 
 def _looks_like_table_separator(line: str) -> bool:
-    stripped = line.strip()
-    return bool(re.match(r"^\|?[\s:\-]+\|[\s:\-\|]*$", stripped))
+    return _TABLE_SEPARATOR_RE.fullmatch(line.strip()) is not None
 
 
 def _split_table_row(line: str) -> list:
@@ -90,19 +444,21 @@ def _split_table_row(line: str) -> list:
     return [part.strip() for part in stripped.split("|")]
 
 
+_BOLD_CELL_RE = re.compile(r"\*\*(.+)\*\*", re.DOTALL)
+
+
 def _strip_bold(text: str) -> str:
     """Strip surrounding ** bold markers from text."""
     s = text.strip()
-    if s.startswith("**") and s.endswith("**") and len(s) > 4:
-        return s[2:-2].strip()
-    return s
+    m = _BOLD_CELL_RE.fullmatch(s)
+    return m.group(1).strip() if m else s
 
 
 def _table_rows_to_list(headers: list, rows: list) -> list:
     if not rows:
         return []
 
-    # Strip bold markers from headers (markdownify may bold <th> content)
+    # Strip bold markers from headers (<th> content is often bolded)
     clean_headers = [_strip_bold(h) for h in headers]
 
     # If all headers are empty, try to use first data row as headers
@@ -115,19 +471,19 @@ def _table_rows_to_list(headers: list, rows: list) -> list:
     if not rows:
         return []
 
+    prefixes = [
+        f"**{header}**: " if header else f"**Column {i + 1}**: "
+        for i, header in enumerate(clean_headers)
+    ]
+
     row_pairs: list[list[str]] = []
     for row in rows:
-        padded = list(row) + [""] * max(0, len(clean_headers) - len(row))
         lines: list[str] = []
-        for i, cell in enumerate(padded):
+        for i, cell in enumerate(row):
             if not cell:
                 continue
-            header = (
-                clean_headers[i]
-                if i < len(clean_headers) and clean_headers[i]
-                else f"Column {i + 1}"
-            )
-            lines.append(f"**{header}**: {cell}")
+            prefix = prefixes[i] if i < len(prefixes) else f"**Column {i + 1}**: "
+            lines.append(prefix + cell)
         if lines:
             row_pairs.append(lines)
 
@@ -145,50 +501,37 @@ def _table_rows_to_list(headers: list, rows: list) -> list:
     return converted
 
 
-_TABLE_PAIR_RE = re.compile(r"^\*\*.+?\*\*: ")
-
-
-def _is_table_pair_line(line: str) -> bool:
-    """Check if a line matches the **Header**: Value table format."""
-    return bool(_TABLE_PAIR_RE.match(_strip_table_marker(line)))
-
-
 def _strip_table_marker(line: str) -> str:
-    if line.startswith((_TABLE_BREAK_MARKER, _TABLE_NO_BREAK_MARKER)):
-        return line[1:]
-    return line
+    return line[1:] if line[:1] in _TABLE_MARKERS else line
 
 
 def _table_marker(line: str) -> str:
-    if line.startswith((_TABLE_BREAK_MARKER, _TABLE_NO_BREAK_MARKER)):
-        return line[0]
-    return ""
+    marker = line[:1]
+    return marker if marker in _TABLE_MARKERS else ""
+
 
+def _apply_table_linebreak_markers(lines: List[str]) -> List[str]:
+    """Strip trailing whitespace and apply hard line breaks marked during table conversion.
 
-def _apply_table_linebreak_markers(md: str) -> str:
-    """Apply pair-level hard line breaks marked during table conversion."""
-    output: list[str] = []
-    for line in md.splitlines():
+    Runs of blank lines are collapsed to one on the way.
+    """
+    output: List[str] = []
+    for line in lines:
         marker = _table_marker(line)
-        content = _strip_table_marker(line)
+        content = (line[1:] if marker else line).rstrip()
         if marker == _TABLE_BREAK_MARKER:
             output.append(content + "  ")
-            continue
-        output.append(content)
-    return "\n".join(output)
+        elif content or (output and output[-1]):
+            output.append(content)
+    return output
 
 
-def _wrap_markdown(md: str) -> str:
-    wrapped = []
-    in_code_fence = False
-    for line in md.splitlines():
+def _wrap_markdown(lines: List[str]) -> List[str]:
+    wrapped: List[str] = []
+    for line, in_code_fence in _iter_fenced_lines(lines):
         marker = _table_marker(line)
-        clean_line = _strip_table_marker(line)
+        clean_line = line[1:] if marker else line
 
-        if clean_line.lstrip().startswith("```"):
-            in_code_fence = not in_code_fence
-            wrapped.append(line)
-            continue
         if not clean_line:
             wrapped.append("")
             continue
@@ -208,24 +551,80 @@ def _wrap_markdown(md: str) -> str:
         else:
             subsequent = leading
 
-        wrapped_text = textwrap.fill(
-            stripped,
-            width=effective_width,
-            initial_indent=leading,
-            subsequent_indent=subsequent,
+        if _IRREGULAR_SPACING_RE.search(stripped):
+            wrapped_lines = _text_wrapper(effective_width, leading, subsequent).wrap(stripped)
+        else:
+            wrapped_lines = _wrap_words(stripped, effective_width, leading, subsequent)
+        if marker:
+            wrapped_lines[0] = marker + wrapped_lines[0]
+        wrapped.extend(wrapped_lines)
+    return wrapped
+
+
+# Whitespace other than single inner spaces, which textwrap collapses or drops.
+_IRREGULAR_SPACING_RE = re.compile(r"[^\S ]|  | $")
+
+
+def _wrap_words(text: str, width: int, initial_indent: str, subsequent_indent: str) -> List[str]:
+    """Wrap single-spaced *text* exactly like the shared ``TextWrapper`` would.
+
+    Jumps to the last space that fits with ``str.rfind`` instead of splitting
+    every word; a word longer than the line stays whole on its own line.
+    """
+    lines: List[str] = []
+    indent = initial_indent
+    start = 0
+    while len(text) - start > width - len(indent):
+        limit = start + width - len(indent)
+        end = text.rfind(" ", start, limit + 1)
+        if end == -1:
+            end = text.find(" ", limit)
+            if end == -1:
+                break
+        lines.append(indent + text[start:end])
+        start = end + 1
+        indent = subsequent_indent
+    lines.append(indent + text[start:])
+    return lines
+
+
+_WRAPPERS: Dict[Tuple[int, str, str], textwrap.TextWrapper] = {}
+
+
+def _text_wrapper(width: int, initial_indent: str, subsequent_indent: str) -> textwrap.TextWrapper:
+    """Return a shared wrapper for the given width and indentation."""
+    key = (width, initial_indent, subsequent_indent)
+    wrapper = _WRAPPERS.get(key)
+    if wrapper is None:
+        wrapper = textwrap.TextWrapper(
+            width=width,
+            initial_indent=initial_indent,
+            subsequent_indent=subsequent_indent,
             break_long_words=False,
             break_on_hyphens=False,
         )
-        if marker:
-            wrapped_lines = wrapped_text.splitlines()
-            wrapped_lines[0] = marker + wrapped_lines[0]
-            wrapped.append("\n".join(wrapped_lines))
+        _WRAPPERS[key] = wrapper
+    return wrapper
+
+
+def _iter_fenced_lines(lines: Iterable[str]) -> Iterator[Tuple[str, bool]]:
+    """Yield each line with a flag telling whether it belongs to a fenced code block.
+
+    Fence delimiter lines themselves are flagged as well.
+    """
+    in_code_fence = False
+    for line in lines:
+        if _strip_table_marker(line).lstrip().startswith("```"):
+            in_code_fence = not in_code_fence
+            yield line, True
             continue
-        wrapped.append(wrapped_text)
-    return "\n".join(wrapped)
+        yield line, in_code_fence
 
 
 _HEADING_RE = re.compile(r"^(#{1,6})\s")
+_HEADING_PREFIXES = tuple("#" * level + " " for level in range(7))
+# Heading prefix after a line break; the literal "\n" lets re skip ahead quickly.
+_NEWLINE_HEADING_RE = re.compile(r"\n(#{1,6})[^\S\n]")
 
 
 def shift_headings(md: str, delta: int) -> str:
@@ -240,18 +639,17 @@ def shift_headings(md: str, delta: int) -> str:
     def _shift(m: re.Match) -> str:  # type: ignore[type-arg]
         hashes = m.group(1)
         new_level = max(1, min(6, len(hashes) + delta))
-        return "#" * new_level + " "
+        return _HEADING_PREFIXES[new_level]
 
-    lines = md.splitlines()
-    result: list[str] = []
-    in_code_fence = False
-    for line in lines:
-        if line.lstrip().startswith("```"):
-            in_code_fence = not in_code_fence
-        if not in_code_fence:
-            line = _HEADING_RE.sub(_shift, line)
-        result.append(line)
-    return "\n".join(result)
+    if "```" not in md:
+        # Without fences every line is eligible: normalize the line breaks in C,
+        # then rewrite all headings in a single pass.
+        text = "\n" + "\n".join(md.splitlines())
+        return _NEWLINE_HEADING_RE.sub(lambda m: "\n" + _shift(m), text)[1:]
+    return "\n".join(
+        line if in_code_fence else _HEADING_RE.sub(_shift, line)
+        for line, in_code_fence in _iter_fenced_lines(md.splitlines())
+    )
 
 
 def normalize_headings(md: str, target_min: int = 2) -> str:
@@ -261,16 +659,16 @@ def normalize_headings(md: str, target_min: int = 2) -> str:
     h4 becomes h3.  Text without headings is returned unchanged.
     """
     min_level = 7
-    in_code_fence = False
-    for line in md.splitlines():
-        if line.lstrip().startswith("```"):
-            in_code_fence = not in_code_fence
-            continue
-        if in_code_fence:
-            continue
-        m = _HEADING_RE.match(line)
-        if m:
-            min_level = min(min_level, len(m.group(1)))
+    if "```" not in md:
+        for heading in _NEWLINE_HEADING_RE.finditer("\n" + "\n".join(md.splitlines())):
+            min_level = min(min_level, len(heading.group(1)))
+    else:
+        for line, in_code_fence in _iter_fenced_lines(md.splitlines()):
+            if in_code_fence:
+                continue
+            m = _HEADING_RE.match(line)
+            if m:
+                min_level = min(min_level, len(m.group(1)))
     if min_level > 6:
         return md  # no headings found
     return shift_headings(md, target_min - min_level)
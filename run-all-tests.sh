@@ -20,6 +20,7 @@ trap 'rm -f "${COVERAGE_JSON}"' EXIT
 
 echo "==> Running pytest with coverage"
 python -m pytest tests/ \
+    -n auto --dist=loadfile \
     --cov=ctrlmap_cli \
     --cov-report=term-missing \
     --cov-report="json:${COVERAGE_JSON}" \
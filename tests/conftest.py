@@ -1 +1,97 @@
 from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from ctrlmap_cli.client import CtrlMapClient
+from ctrlmap_cli.models.config import AppConfig
+
+_PROCEDURE_PATH = re.compile(r"/procedure/(\d+)(/controls|/requirements)?")
+
+
+@pytest.fixture(scope="session")
+def app_config() -> AppConfig:
+    """A valid configuration shared by tests that do not exercise validation."""
+    return AppConfig(
+        api_url="https://api.eu.ctrlmap.com/",
+        bearer_token="test-token",
+        tenant_uri="dime2",
+    )
+
+
+class FakeClient(CtrlMapClient):
+    """Serves canned list, detail, control and requirement payloads without HTTP.
+
+    Detail lookups fall back to *detail* for IDs missing from *details*. The raw
+    ``post``/``get`` routes serve the same procedure data as the typed methods.
+    Wrap an instance in ``MagicMock(wraps=...)`` to assert on calls.
+    """
+
+    def __init__(
+        self,
+        list_items: Optional[List[Dict[str, Any]]] = None,
+        details: Optional[Dict[int, Dict[str, Any]]] = None,
+        controls: Optional[Dict[int, List[Dict[str, Any]]]] = None,
+        requirements: Optional[Dict[int, List[Dict[str, Any]]]] = None,
+        *,
+        detail: Optional[Dict[str, Any]] = None,
+        list_response: Any = None,
+        areas: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        self._list_items = list_items or []
+        self._details = details or {}
+        self._controls = controls or {}
+        self._requirements = requirements or {}
+        self._detail = detail or {}
+        self._list_response = list_response
+        self._areas = areas or []
+
+    def _get_detail(self, doc_id: int) -> Dict[str, Any]:
+        return self._details.get(doc_id, self._detail)
+
+    def post(self, path: str, json: Optional[Dict[str, Any]] = None) -> Any:
+        if path == "/procedures":
+            return self._list_items
+        return []
+
+    def get(self, path: str, params: Optional[Dict[str, str]] = None) -> Any:
+        match = _PROCEDURE_PATH.fullmatch(path)
+        if match is None:
+            return []
+        doc_id = int(match.group(1))
+        if match.group(2) == "/controls":
+            return self._controls.get(doc_id, [])
+        if match.group(2) == "/requirements":
+            return self._requirements.get(doc_id, [])
+        return self._get_detail(doc_id)
+
+    def list_policies(self) -> Any:
+        return self._list_items
+
+    def get_policy(self, policy_id: int) -> Any:
+        return self._get_detail(policy_id)
+
+    def list_procedures(self) -> Any:
+        return self._list_items
+
+    def get_procedure(self, procedure_id: int) -> Any:
+        return self._get_detail(procedure_id)
+
+    def get_procedure_controls(self, procedure_id: int) -> Any:
+        return self._controls.get(procedure_id, [])
+
+    def get_procedure_requirements(self, procedure_id: int) -> Any:
+        return self._requirements.get(procedure_id, [])
+
+    def list_risks(self) -> Any:
+        if self._list_response is not None:
+            return self._list_response
+        return {"riskDTOS": self._list_items}
+
+    def get_risk(self, risk_id: int) -> Any:
+        return self._get_detail(risk_id)
+
+    def get_risk_areas(self, risk_id: int) -> Any:
+        return self._areas
@@ -178,6 +178,17 @@ class TestParserArgStructure:
         with pytest.raises(SystemExit):
             parser.parse_args(["--copy-all", "--copy-gov", "GOV-1"])
 
+    def test_concurrency_defaults_to_eight(self) -> None:
+        assert _build_parser().parse_args([]).concurrency == 8
+
+    def test_concurrency_accepts_positive_int(self) -> None:
+        assert _build_parser().parse_args(["--concurrency", "2"]).concurrency == 2
+
+    @pytest.mark.parametrize("value", ["0", "-1", "many"])
+    def test_concurrency_rejects_invalid_values(self, value: str) -> None:
+        with pytest.raises(SystemExit):
+            _build_parser().parse_args(["--concurrency", value])
+
     def test_defaults_are_none_or_false(self) -> None:
         parser = _build_parser()
         args = parser.parse_args([])
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import re
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Dict, Iterator, Optional, Pattern, Tuple
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,26 +14,69 @@ from ctrlmap_cli.exceptions import ApiError, AuthenticationError, CtrlMapError
 from ctrlmap_cli.models.config import AppConfig
 
 
-def _make_client() -> CtrlMapClient:
-    config = AppConfig(
-        api_url="https://api.eu.ctrlmap.com/",
-        bearer_token="test-token",
-        tenant_uri="dime2",
-    )
-    return CtrlMapClient(config)
+@pytest.fixture(scope="module")
+def client(app_config: AppConfig) -> CtrlMapClient:
+    """One client shared by the module; tests patch its session per call."""
+    return CtrlMapClient(app_config)
 
 
-def _mock_response(status_code: int = 200, json_data: object = None) -> MagicMock:
-    resp = MagicMock(spec=requests.Response)
-    resp.status_code = status_code
-    resp.json.return_value = json_data if json_data is not None else {}
-    resp.raise_for_status = MagicMock()
-    return resp
+@contextmanager
+def _stub_request(session: requests.Session, fake: MagicMock) -> Iterator[MagicMock]:
+    """Swap ``session.request`` for *fake*; cheaper than ``patch.object``."""
+    setattr(session, "request", fake)
+    try:
+        yield fake
+    finally:
+        delattr(session, "request")
+
+
+def _mock_response(
+    status_code: int = 200,
+    json_data: object = None,
+    raise_for_status: Optional[Exception] = None,
+) -> SimpleNamespace:
+    """Build a minimal response fake; *json_data* may be an exception to raise from ``json()``."""
+    payload = {} if json_data is None else json_data
+
+    def _json() -> object:
+        if isinstance(payload, Exception):
+            raise payload
+        return payload
+
+    def _raise_for_status() -> None:
+        if raise_for_status is not None:
+            raise raise_for_status
+
+    return SimpleNamespace(status_code=status_code, json=_json, raise_for_status=_raise_for_status)
+
+
+_BEARER_EXPIRED_RE = re.compile("bearer token may have expired")
+_NOT_FOUND_RE = re.compile("Resource not found: procedure/999")
+_SERVER_500_RE = re.compile(r"server error \(500\)")
+_SERVER_502_RE = re.compile(r"server error \(502\)")
+_CANNOT_CONNECT_RE = re.compile("Cannot connect to")
+_REQUEST_FAILED_400_RE = re.compile(r"request failed \(400\) for procedure/1")
+_INVALID_JSON_RE = re.compile("Invalid response from ControlMap API for procedure/1")
+_CANNOT_DOWNLOAD_RE = re.compile("Cannot download file")
+_DOWNLOAD_FAILED_RE = re.compile("Failed to download file")
+_DOWNLOAD_FAILED_403_RE = re.compile(r"Failed to download file \(403\)")
+
+
+def _assert_single_call(mock: MagicMock, *args: object, **kwargs: object) -> None:
+    """Like ``assert_called_once_with`` without building a ``_Call`` on the happy path."""
+    assert mock.call_count == 1
+    assert mock.call_args.args == args
+    assert mock.call_args.kwargs == kwargs
+
+
+# Shared responses for tests that only check the request shape.
+_EMPTY_DICT_RESPONSE = _mock_response(200, {})
+_EMPTY_LIST_RESPONSE = _mock_response(200, [])
 
 
 class TestClientHeaders:
-    def test_session_headers(self) -> None:
-        client = _make_client()
+    def test_session_headers(self, app_config: AppConfig) -> None:
+        client = CtrlMapClient(app_config)
         headers = client._session.headers
         assert headers["Authorization"] == "Bearer test-token"
         assert headers["x-authprovider"] == "cmapjwt"
@@ -38,143 +85,118 @@ class TestClientHeaders:
 
 
 class TestGet:
-    def test_get_success(self) -> None:
-        client = _make_client()
+    def test_get_success(self, client: CtrlMapClient) -> None:
         mock_resp = _mock_response(200, {"id": 1, "name": "test"})
-        with patch.object(client._session, "request", return_value=mock_resp) as mock_req:
+        with _stub_request(client._session, MagicMock(return_value=mock_resp)) as mock_req:
             result = client.get("procedure/37")
-        mock_req.assert_called_once_with(
-            "GET", "https://api.eu.ctrlmap.com/procedure/37", params=None,
+        _assert_single_call(
+            mock_req, "GET", "https://api.eu.ctrlmap.com/procedure/37", params=None,
         )
         assert result == {"id": 1, "name": "test"}
 
-    def test_get_with_params(self) -> None:
-        client = _make_client()
-        mock_resp = _mock_response(200, [])
-        with patch.object(client._session, "request", return_value=mock_resp) as mock_req:
+    def test_get_with_params(self, client: CtrlMapClient) -> None:
+        with _stub_request(client._session, MagicMock(return_value=_EMPTY_LIST_RESPONSE)) as mock_req:
             client.get("procedure/versions", params={"procedureid": "37"})
-        mock_req.assert_called_once_with(
-            "GET", "https://api.eu.ctrlmap.com/procedure/versions",
+        _assert_single_call(
+            mock_req, "GET", "https://api.eu.ctrlmap.com/procedure/versions",
             params={"procedureid": "37"},
         )
 
-    def test_get_strips_leading_slash(self) -> None:
-        client = _make_client()
-        mock_resp = _mock_response(200, {})
-        with patch.object(client._session, "request", return_value=mock_resp) as mock_req:
+    def test_get_strips_leading_slash(self, client: CtrlMapClient) -> None:
+        with _stub_request(client._session, MagicMock(return_value=_EMPTY_DICT_RESPONSE)) as mock_req:
             client.get("/procedure/37")
-        mock_req.assert_called_once_with(
-            "GET", "https://api.eu.ctrlmap.com/procedure/37", params=None,
+        _assert_single_call(
+            mock_req, "GET", "https://api.eu.ctrlmap.com/procedure/37", params=None,
         )
 
 
 class TestPost:
-    def test_post_success(self) -> None:
-        client = _make_client()
+    def test_post_success(self, client: CtrlMapClient) -> None:
         body = {"startpos": 0, "pagesize": 500, "rules": []}
         mock_resp = _mock_response(200, [{"id": 1}])
-        with patch.object(client._session, "request", return_value=mock_resp) as mock_req:
+        with _stub_request(client._session, MagicMock(return_value=mock_resp)) as mock_req:
             result = client.post("procedures", json=body)
-        mock_req.assert_called_once_with(
-            "POST", "https://api.eu.ctrlmap.com/procedures", json=body,
+        _assert_single_call(
+            mock_req, "POST", "https://api.eu.ctrlmap.com/procedures", json=body,
         )
         assert result == [{"id": 1}]
 
 
-class TestPolicyHelpers:
-    def test_list_policies_endpoint(self) -> None:
-        client = _make_client()
-        mock_resp = _mock_response(200, [{"id": 4}])
-
-        with patch.object(client._session, "request", return_value=mock_resp) as mock_req:
-            result = client.list_policies()
+_BASE_URL = "https://api.eu.ctrlmap.com"
 
-        expected_body = {
+# (client method, args, response payload, HTTP method, URL, request kwargs)
+_POLICY_PROCEDURE_HELPER_CASES = [
+    pytest.param(
+        "list_policies", (), [{"id": 4}], "POST", f"{_BASE_URL}/policies",
+        {"json": {
             "startpos": 0,
             "pagesize": 1000,
             "sortby": None,
             "rules": [{"field": "type", "operator": "=", "value": "policy"}],
-        }
-        mock_req.assert_called_once_with(
-            "POST", "https://api.eu.ctrlmap.com/policies", json=expected_body,
-        )
-        assert result == [{"id": 4}]
-
-    def test_get_policy_detail(self) -> None:
-        client = _make_client()
-        mock_resp = _mock_response(200, {"id": 4, "policyCode": "POL-4"})
-
-        with patch.object(client._session, "request", return_value=mock_resp) as mock_req:
-            result = client.get_policy(4)
-
-        mock_req.assert_called_once_with(
-            "GET", "https://api.eu.ctrlmap.com/policy/4", params=None,
-        )
-        assert result["policyCode"] == "POL-4"
-
-
-class TestProcedureHelpers:
-    def test_list_procedures_endpoint(self) -> None:
-        client = _make_client()
-        mock_resp = _mock_response(200, [{"id": 28}])
-
-        with patch.object(client._session, "request", return_value=mock_resp) as mock_req:
-            result = client.list_procedures()
-
-        expected_body = {
+        }},
+        id="list_policies",
+    ),
+    pytest.param(
+        "get_policy", (4,), {"id": 4, "policyCode": "POL-4"}, "GET", f"{_BASE_URL}/policy/4",
+        {"params": None},
+        id="get_policy",
+    ),
+    pytest.param(
+        "list_procedures", (), [{"id": 28}], "POST", f"{_BASE_URL}/procedures",
+        {"json": {
             "startpos": 0,
             "pagesize": 500,
             "sortby": None,
             "rules": [{"field": "type", "operator": "=", "value": "procedure"}],
-        }
-        mock_req.assert_called_once_with(
-            "POST", "https://api.eu.ctrlmap.com/procedures", json=expected_body,
-        )
-        assert result == [{"id": 28}]
-
-    def test_get_procedure_detail(self) -> None:
-        client = _make_client()
-        mock_resp = _mock_response(200, {"id": 28, "procedureCode": "PRO-3"})
-
-        with patch.object(client._session, "request", return_value=mock_resp) as mock_req:
-            result = client.get_procedure(28)
-
-        mock_req.assert_called_once_with(
-            "GET", "https://api.eu.ctrlmap.com/procedure/28", params=None,
-        )
-        assert result["procedureCode"] == "PRO-3"
-
-    def test_get_procedure_controls(self) -> None:
-        client = _make_client()
-        mock_resp = _mock_response(200, [{"controlCode": "A.5.1"}])
-
-        with patch.object(client._session, "request", return_value=mock_resp) as mock_req:
-            result = client.get_procedure_controls(28)
-
-        mock_req.assert_called_once_with(
-            "GET", "https://api.eu.ctrlmap.com/procedure/28/controls", params=None,
-        )
-        assert result == [{"controlCode": "A.5.1"}]
-
-    def test_get_procedure_requirements(self) -> None:
-        client = _make_client()
-        mock_resp = _mock_response(200, [{"requirementCode": "ISO-1"}])
-
-        with patch.object(client._session, "request", return_value=mock_resp) as mock_req:
-            result = client.get_procedure_requirements(28)
-
-        mock_req.assert_called_once_with(
-            "GET", "https://api.eu.ctrlmap.com/procedure/28/requirements", params=None,
-        )
-        assert result == [{"requirementCode": "ISO-1"}]
+        }},
+        id="list_procedures",
+    ),
+    pytest.param(
+        "get_procedure", (28,), {"id": 28, "procedureCode": "PRO-3"}, "GET", f"{_BASE_URL}/procedure/28",
+        {"params": None},
+        id="get_procedure",
+    ),
+    pytest.param(
+        "get_procedure_controls", (28,), [{"controlCode": "A.5.1"}], "GET",
+        f"{_BASE_URL}/procedure/28/controls",
+        {"params": None},
+        id="get_procedure_controls",
+    ),
+    pytest.param(
+        "get_procedure_requirements", (28,), [{"requirementCode": "ISO-1"}], "GET",
+        f"{_BASE_URL}/procedure/28/requirements",
+        {"params": None},
+        id="get_procedure_requirements",
+    ),
+]
+
+
+class TestPolicyProcedureHelpers:
+    @pytest.mark.parametrize("method,args,payload,http_method,url,kwargs", _POLICY_PROCEDURE_HELPER_CASES)
+    def test_request_shape(
+        self,
+        client: CtrlMapClient,
+        method: str,
+        args: Tuple[object, ...],
+        payload: object,
+        http_method: str,
+        url: str,
+        kwargs: Dict[str, object],
+    ) -> None:
+        mock_resp = _mock_response(200, payload)
+
+        with _stub_request(client._session, MagicMock(return_value=mock_resp)) as mock_req:
+            result = getattr(client, method)(*args)
+
+        _assert_single_call(mock_req, http_method, url, **kwargs)
+        assert result == payload
 
 
 class TestRiskHelpers:
-    def test_list_risks_endpoint(self) -> None:
-        client = _make_client()
+    def test_list_risks_endpoint(self, client: CtrlMapClient) -> None:
         mock_resp = _mock_response(200, {"riskDTOS": [{"id": 32}]})
 
-        with patch.object(client._session, "request", return_value=mock_resp) as mock_req:
+        with _stub_request(client._session, MagicMock(return_value=mock_resp)) as mock_req:
             result = client.list_risks()
 
         expected_body = {
@@ -182,103 +204,70 @@ class TestRiskHelpers:
             "pagesize": 500,
             "rules": [],
         }
-        mock_req.assert_called_once_with(
-            "POST", "https://api.eu.ctrlmap.com/risks", json=expected_body,
+        _assert_single_call(
+            mock_req, "POST", "https://api.eu.ctrlmap.com/risks", json=expected_body,
         )
         assert result == {"riskDTOS": [{"id": 32}]}
 
-    def test_get_risk_detail(self) -> None:
-        client = _make_client()
+    def test_get_risk_detail(self, client: CtrlMapClient) -> None:
         mock_resp = _mock_response(200, {"id": 32, "riskid": "RSK-1"})
 
-        with patch.object(client._session, "request", return_value=mock_resp) as mock_req:
+        with _stub_request(client._session, MagicMock(return_value=mock_resp)) as mock_req:
             result = client.get_risk(32)
 
-        mock_req.assert_called_once_with(
-            "GET", "https://api.eu.ctrlmap.com/risks/32", params=None,
+        _assert_single_call(
+            mock_req, "GET", "https://api.eu.ctrlmap.com/risks/32", params=None,
         )
         assert result["riskid"] == "RSK-1"
 
-    def test_get_risk_areas(self) -> None:
-        client = _make_client()
+    def test_get_risk_areas(self, client: CtrlMapClient) -> None:
         mock_resp = _mock_response(200, [{"id": 1, "title": "Health & Safety"}])
 
-        with patch.object(client._session, "request", return_value=mock_resp) as mock_req:
+        with _stub_request(client._session, MagicMock(return_value=mock_resp)) as mock_req:
             result = client.get_risk_areas(32)
 
-        mock_req.assert_called_once_with(
-            "GET", "https://api.eu.ctrlmap.com/riskarea",
+        _assert_single_call(
+            mock_req, "GET", "https://api.eu.ctrlmap.com/riskarea",
             params={"riskId": "32"},
         )
         assert result == [{"id": 1, "title": "Health & Safety"}]
 
 
 class TestErrorHandling:
-    def test_401_raises_authentication_error(self) -> None:
-        client = _make_client()
-        mock_resp = _mock_response(401)
-        with patch.object(client._session, "request", return_value=mock_resp):
-            with pytest.raises(AuthenticationError, match="bearer token may have expired"):
-                client.get("procedure/1")
-
-    def test_403_raises_authentication_error(self) -> None:
-        client = _make_client()
-        mock_resp = _mock_response(403)
-        with patch.object(client._session, "request", return_value=mock_resp):
-            with pytest.raises(AuthenticationError, match="bearer token may have expired"):
-                client.get("procedure/1")
-
-    def test_404_raises_api_error(self) -> None:
-        client = _make_client()
-        mock_resp = _mock_response(404)
-        with patch.object(client._session, "request", return_value=mock_resp):
-            with pytest.raises(ApiError, match="Resource not found: procedure/999"):
-                client.get("procedure/999")
-
-    def test_500_raises_api_error(self) -> None:
-        client = _make_client()
-        mock_resp = _mock_response(500)
-        with patch.object(client._session, "request", return_value=mock_resp):
-            with pytest.raises(ApiError, match="server error \\(500\\)"):
-                client.get("procedure/1")
-
-    def test_502_raises_api_error(self) -> None:
-        client = _make_client()
-        mock_resp = _mock_response(502)
-        with patch.object(client._session, "request", return_value=mock_resp):
-            with pytest.raises(ApiError, match="server error \\(502\\)"):
-                client.get("procedure/1")
-
-    def test_connection_error_raises_api_error(self) -> None:
-        client = _make_client()
-        with patch.object(
-            client._session, "request", side_effect=requests.ConnectionError("refused"),
-        ):
-            with pytest.raises(ApiError, match="Cannot connect to"):
-                client.get("procedure/1")
-
-    def test_request_exception_raises_api_error(self) -> None:
-        client = _make_client()
-        with patch.object(
-            client._session, "request", side_effect=requests.RequestException("timeout"),
-        ):
-            with pytest.raises(ApiError, match="Cannot connect to"):
+    @pytest.mark.parametrize("status_code,error_type,match,path", [
+        (401, AuthenticationError, _BEARER_EXPIRED_RE, "procedure/1"),
+        (403, AuthenticationError, _BEARER_EXPIRED_RE, "procedure/1"),
+        (404, ApiError, _NOT_FOUND_RE, "procedure/999"),
+        (500, ApiError, _SERVER_500_RE, "procedure/1"),
+        (502, ApiError, _SERVER_502_RE, "procedure/1"),
+    ])
+    def test_error_status_raises(
+        self, client: CtrlMapClient, status_code: int, error_type: type, match: Pattern[str], path: str,
+    ) -> None:
+        mock_resp = _mock_response(status_code)
+        with _stub_request(client._session, MagicMock(return_value=mock_resp)):
+            with pytest.raises(error_type, match=match):
+                client.get(path)
+
+    @pytest.mark.parametrize("error", [
+        requests.ConnectionError("refused"),
+        requests.RequestException("timeout"),
+    ])
+    def test_transport_error_raises_api_error(self, client: CtrlMapClient, error: Exception) -> None:
+        with _stub_request(client._session, MagicMock(side_effect=error)):
+            with pytest.raises(ApiError, match=_CANNOT_CONNECT_RE):
                 client.get("procedure/1")
 
-    def test_unmapped_4xx_raises_api_error(self) -> None:
-        client = _make_client()
-        mock_resp = _mock_response(400)
-        mock_resp.raise_for_status.side_effect = requests.HTTPError("400 bad request")
-        with patch.object(client._session, "request", return_value=mock_resp):
-            with pytest.raises(ApiError, match="request failed \\(400\\) for procedure/1"):
+    def test_unmapped_4xx_raises_api_error(self, client: CtrlMapClient) -> None:
+        mock_resp = _mock_response(400, raise_for_status=requests.HTTPError("400 bad request"))
+        with _stub_request(client._session, MagicMock(return_value=mock_resp)):
+            with pytest.raises(ApiError, match=_REQUEST_FAILED_400_RE):
                 client.get("procedure/1")
 
-    def test_invalid_json_raises_api_error(self) -> None:
-        client = _make_client()
-        mock_resp = _mock_response(200)
-        mock_resp.json.side_effect = ValueError("invalid json")
-        with patch.object(client._session, "request", return_value=mock_resp):
-            with pytest.raises(ApiError, match="Invalid response from ControlMap API for procedure/1"):
+    def test_invalid_json_raises_api_error(self, client: CtrlMapClient) -> None:
+        mock_resp = _mock_response(200, ValueError("invalid json"))
+        with _stub_request(client._session, MagicMock(return_value=mock_resp)):
+            with pytest.raises(ApiError, match=_INVALID_JSON_RE):
                 client.get("procedure/1")
 
     def test_error_types_are_ctrlmap_errors(self) -> None:
@@ -287,11 +276,10 @@ class TestErrorHandling:
 
 
 class TestVendorHelpers:
-    def test_list_vendors_endpoint(self) -> None:
-        client = _make_client()
+    def test_list_vendors_endpoint(self, client: CtrlMapClient) -> None:
         mock_resp = _mock_response(200, [{"id": 41}])
 
-        with patch.object(client._session, "request", return_value=mock_resp) as mock_req:
+        with _stub_request(client._session, MagicMock(return_value=mock_resp)) as mock_req:
             result = client.list_vendors()
 
         expected_body = {
@@ -299,79 +287,73 @@ class TestVendorHelpers:
             "pagesize": 500,
             "rules": [],
         }
-        mock_req.assert_called_once_with(
-            "POST", "https://api.eu.ctrlmap.com/vendors", json=expected_body,
+        _assert_single_call(
+            mock_req, "POST", "https://api.eu.ctrlmap.com/vendors", json=expected_body,
         )
         assert result == [{"id": 41}]
 
-    def test_get_vendor_detail(self) -> None:
-        client = _make_client()
+    def test_get_vendor_detail(self, client: CtrlMapClient) -> None:
         mock_resp = _mock_response(200, {"id": 41, "code": "VND-17"})
 
-        with patch.object(client._session, "request", return_value=mock_resp) as mock_req:
+        with _stub_request(client._session, MagicMock(return_value=mock_resp)) as mock_req:
             result = client.get_vendor(41)
 
-        mock_req.assert_called_once_with(
-            "GET", "https://api.eu.ctrlmap.com/vendor/41", params=None,
+        _assert_single_call(
+            mock_req, "GET", "https://api.eu.ctrlmap.com/vendor/41", params=None,
         )
         assert result["code"] == "VND-17"
 
-    def test_get_vendor_risks(self) -> None:
-        client = _make_client()
+    def test_get_vendor_risks(self, client: CtrlMapClient) -> None:
         mock_resp = _mock_response(200, [{"id": 33}])
 
-        with patch.object(client._session, "request", return_value=mock_resp) as mock_req:
+        with _stub_request(client._session, MagicMock(return_value=mock_resp)) as mock_req:
             result = client.get_vendor_risks(41)
 
-        mock_req.assert_called_once_with(
-            "GET", "https://api.eu.ctrlmap.com/vendor/risks",
+        _assert_single_call(
+            mock_req, "GET", "https://api.eu.ctrlmap.com/vendor/risks",
             params={"vendorId": "41"},
         )
         assert result == [{"id": 33}]
 
-    def test_get_vendor_hyperlinks(self) -> None:
-        client = _make_client()
+    def test_get_vendor_hyperlinks(self, client: CtrlMapClient) -> None:
         mock_resp = _mock_response(200, [{"id": 56}])
 
-        with patch.object(client._session, "request", return_value=mock_resp) as mock_req:
+        with _stub_request(client._session, MagicMock(return_value=mock_resp)) as mock_req:
             result = client.get_vendor_hyperlinks(41)
 
-        mock_req.assert_called_once_with(
-            "GET", "https://api.eu.ctrlmap.com/vendor/hyperlinks",
+        _assert_single_call(
+            mock_req, "GET", "https://api.eu.ctrlmap.com/vendor/hyperlinks",
             params={"vendorId": "41"},
         )
         assert result == [{"id": 56}]
 
-    def test_get_vendor_contacts(self) -> None:
-        client = _make_client()
+    def test_get_vendor_contacts(self, client: CtrlMapClient) -> None:
         mock_resp = _mock_response(200, [{"id": 1}])
 
-        with patch.object(client._session, "request", return_value=mock_resp) as mock_req:
+        with _stub_request(client._session, MagicMock(return_value=mock_resp)) as mock_req:
             result = client.get_vendor_contacts(41)
 
-        mock_req.assert_called_once_with(
-            "GET", "https://api.eu.ctrlmap.com/vendor/contacts",
+        _assert_single_call(
+            mock_req, "GET", "https://api.eu.ctrlmap.com/vendor/contacts",
             params={"vendorId": "41"},
         )
         assert result == [{"id": 1}]
 
-    def test_get_vendor_quick_assessment(self) -> None:
-        client = _make_client()
+    def test_get_vendor_quick_assessment(self, client: CtrlMapClient) -> None:
         mock_resp = _mock_response(200, {"totalQuestions": 10})
 
-        with patch.object(client._session, "request", return_value=mock_resp) as mock_req:
+        with _stub_request(client._session, MagicMock(return_value=mock_resp)) as mock_req:
             result = client.get_vendor_quick_assessment(42, 42)
 
-        mock_req.assert_called_once_with(
-            "GET", "https://api.eu.ctrlmap.com/vendor/question/checklist",
+        _assert_single_call(
+            mock_req, "GET", "https://api.eu.ctrlmap.com/vendor/question/checklist",
             params={"vendorAssessmentId": "42", "assessmentLinkId": "42"},
         )
         assert result == {"totalQuestions": 10}
 
 
 class TestDownloadFile:
-    def test_download_success(self) -> None:
-        client = _make_client()
+    def test_download_success(self, client: CtrlMapClient) -> None:
         mock_resp = MagicMock()
         mock_resp.status_code = 200
         mock_resp.content = b"PDF content"
@@ -379,32 +361,29 @@ class TestDownloadFile:
         with patch("ctrlmap_cli.client.requests.get", return_value=mock_resp) as mock_get:
             result = client.download_file("https://s3.example.com/file.pdf")
 
-        mock_get.assert_called_once_with("https://s3.example.com/file.pdf", timeout=120)
+        _assert_single_call(mock_get, "https://s3.example.com/file.pdf", timeout=120)
         assert result == b"PDF content"
 
-    def test_download_connection_error(self) -> None:
-        client = _make_client()
+    def test_download_connection_error(self, client: CtrlMapClient) -> None:
         with patch(
             "ctrlmap_cli.client.requests.get",
             side_effect=requests.ConnectionError("refused"),
         ):
-            with pytest.raises(ApiError, match="Cannot download file"):
+            with pytest.raises(ApiError, match=_CANNOT_DOWNLOAD_RE):
                 client.download_file("https://s3.example.com/file.pdf")
 
-    def test_download_request_exception(self) -> None:
-        client = _make_client()
+    def test_download_request_exception(self, client: CtrlMapClient) -> None:
         with patch(
             "ctrlmap_cli.client.requests.get",
             side_effect=requests.RequestException("timeout"),
         ):
-            with pytest.raises(ApiError, match="Failed to download file"):
+            with pytest.raises(ApiError, match=_DOWNLOAD_FAILED_RE):
                 client.download_file("https://s3.example.com/file.pdf")
 
-    def test_download_http_error(self) -> None:
-        client = _make_client()
+    def test_download_http_error(self, client: CtrlMapClient) -> None:
         mock_resp = MagicMock()
         mock_resp.status_code = 403
 
         with patch("ctrlmap_cli.client.requests.get", return_value=mock_resp):
-            with pytest.raises(ApiError, match="Failed to download file \\(403\\)"):
+            with pytest.raises(ApiError, match=_DOWNLOAD_FAILED_403_RE):
                 client.download_file("https://s3.example.com/file.pdf")
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
 from ctrlmap_cli.config import (
@@ -24,9 +26,12 @@ def _make_config(
     )
 
 
+_DEFAULT_CONFIG = _make_config()
+
+
 class TestAppConfig:
     def test_valid_config(self) -> None:
-        cfg = _make_config()
+        cfg = _DEFAULT_CONFIG
         assert cfg.api_url == "https://api.eu.ctrlmap.com/"
         assert cfg.bearer_token == "test-token-123"
         assert cfg.tenant_uri == "dime2"
@@ -53,80 +58,64 @@ class TestAppConfig:
 
 
 class TestConfigExists:
-    def test_exists_false(self, tmp_path: object) -> None:
-        assert config_exists(tmp_path) is False  # type: ignore[arg-type]
+    def test_exists_false(self, tmp_path: Path) -> None:
+        assert config_exists(tmp_path) is False
 
-    def test_exists_true(self, tmp_path: object) -> None:
-        from pathlib import Path
-        p = Path(str(tmp_path))
-        (p / CONFIG_FILENAME).write_text("[ctrlmap]\n", encoding="utf-8")
-        assert config_exists(p) is True
+    def test_exists_true(self, tmp_path: Path) -> None:
+        (tmp_path / CONFIG_FILENAME).write_text("[ctrlmap]\n", encoding="utf-8")
+        assert config_exists(tmp_path) is True
 
 
 class TestWriteReadRoundTrip:
-    def test_round_trip(self, tmp_path: object) -> None:
-        from pathlib import Path
-        p = Path(str(tmp_path))
-        original = _make_config()
-        write_config(p, original)
+    def test_round_trip(self, tmp_path: Path) -> None:
+        original = _DEFAULT_CONFIG
+        write_config(tmp_path, original)
 
-        assert (p / CONFIG_FILENAME).is_file()
+        assert (tmp_path / CONFIG_FILENAME).is_file()
 
-        loaded = read_config(p)
+        loaded = read_config(tmp_path)
         assert loaded.api_url == original.api_url
         assert loaded.bearer_token == original.bearer_token
         assert loaded.tenant_uri == original.tenant_uri
 
-    def test_round_trip_url_normalized(self, tmp_path: object) -> None:
-        from pathlib import Path
-        p = Path(str(tmp_path))
+    def test_round_trip_url_normalized(self, tmp_path: Path) -> None:
         original = _make_config(api_url="https://api.eu.ctrlmap.com")
-        write_config(p, original)
+        write_config(tmp_path, original)
 
-        loaded = read_config(p)
+        loaded = read_config(tmp_path)
         assert loaded.api_url == "https://api.eu.ctrlmap.com/"
 
 
 class TestReadConfigErrors:
-    def test_missing_file(self, tmp_path: object) -> None:
-        from pathlib import Path
-        p = Path(str(tmp_path))
+    def test_missing_file(self, tmp_path: Path) -> None:
         with pytest.raises(ConfigError, match="Configuration not found"):
-            read_config(p)
+            read_config(tmp_path)
 
-    def test_missing_section(self, tmp_path: object) -> None:
-        from pathlib import Path
-        p = Path(str(tmp_path))
-        (p / CONFIG_FILENAME).write_text("[wrong]\nkey = val\n", encoding="utf-8")
+    def test_missing_section(self, tmp_path: Path) -> None:
+        (tmp_path / CONFIG_FILENAME).write_text("[wrong]\nkey = val\n", encoding="utf-8")
         with pytest.raises(ConfigError, match="missing \\[ctrlmap\\] section"):
-            read_config(p)
+            read_config(tmp_path)
 
-    def test_missing_key(self, tmp_path: object) -> None:
-        from pathlib import Path
-        p = Path(str(tmp_path))
-        (p / CONFIG_FILENAME).write_text(
+    def test_missing_key(self, tmp_path: Path) -> None:
+        (tmp_path / CONFIG_FILENAME).write_text(
             "[ctrlmap]\napi_url = https://x.com/\nbearer_token = tok\n",
             encoding="utf-8",
         )
         with pytest.raises(ConfigError, match="missing or empty 'tenant_uri'"):
-            read_config(p)
+            read_config(tmp_path)
 
-    def test_empty_value(self, tmp_path: object) -> None:
-        from pathlib import Path
-        p = Path(str(tmp_path))
-        (p / CONFIG_FILENAME).write_text(
+    def test_empty_value(self, tmp_path: Path) -> None:
+        (tmp_path / CONFIG_FILENAME).write_text(
             "[ctrlmap]\napi_url = https://x.com/\nbearer_token =\ntenant_uri = t\n",
             encoding="utf-8",
         )
         with pytest.raises(ConfigError, match="missing or empty 'bearer_token'"):
-            read_config(p)
+            read_config(tmp_path)
 
-    def test_malformed_ini_syntax(self, tmp_path: object) -> None:
-        from pathlib import Path
-        p = Path(str(tmp_path))
-        (p / CONFIG_FILENAME).write_text(
+    def test_malformed_ini_syntax(self, tmp_path: Path) -> None:
+        (tmp_path / CONFIG_FILENAME).write_text(
             "not-an-ini\napi_url = https://x.com/\n",
             encoding="utf-8",
         )
         with pytest.raises(ConfigError, match="Invalid configuration format"):
-            read_config(p)
+            read_config(tmp_path)
@@ -1,36 +1,138 @@
 from __future__ import annotations
 
+import os
+import shutil
+import sys
+import threading
+import time
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from typing import Any, Dict, Generator, List, Set, Type, cast
+from unittest.mock import MagicMock, patch, sentinel
+from urllib.parse import quote
 
 import pytest
 
+import ctrlmap_cli.cli as cli
+from ctrlmap_cli.client import CtrlMapClient
 from ctrlmap_cli.exporters.base import BaseExporter
 from ctrlmap_cli.exporters.policies import PoliciesExporter
 from ctrlmap_cli.exporters.procedures import ProceduresExporter
 from ctrlmap_cli.exporters.risks import RisksExporter
 from ctrlmap_cli.models.config import AppConfig
+from tests.conftest import FakeClient
+
+_QUOTED_BODY = quote(quote("<p>Body.</p>", safe=""), safe="")
+
+# The CLI only reads the config it is handed, so the wiring tests share one.
+_CONFIG = AppConfig(
+    api_url="https://api.eu.ctrlmap.com/",
+    bearer_token="token",
+    tenant_uri="dime2",
+)
+
+
+_RISK_TEMPLATE: Dict[str, Any] = {
+    "description": "risk body",
+    "state": "red",
+    "status": {"name": "Open"},
+    "userDTO": {"fullname": "Owner"},
+    "systemLabels": [],
+    "scoreDetailMap": {},
+    "businessImpact": "",
+    "existingControls": "",
+    "residualTreatmentPlan": "",
+    "controls": [],
+    "actionItems": [],
+    "threats": [],
+    "vulnerabilities": [],
+}
 
 
 def _make_risk_detail(doc_id: int = 32, code: str = "RSK-1", name: str = "Risk") -> dict:
-    return {
-        "id": doc_id,
-        "riskid": code,
-        "name": f" {name} ",
-        "description": "risk body",
-        "state": "red",
-        "status": {"name": "Open"},
-        "userDTO": {"fullname": "Owner"},
-        "systemLabels": [],
-        "scoreDetailMap": {},
-        "businessImpact": "",
-        "existingControls": "",
-        "residualTreatmentPlan": "",
-        "controls": [],
-        "actionItems": [],
-        "threats": [],
-        "vulnerabilities": [],
-    }
+    # Shallow copy: nested values are shared, which is fine since exporters never mutate payloads.
+    return {**_RISK_TEMPLATE, "id": doc_id, "riskid": code, "name": f" {name} "}
+
+
+_POLICY_TEMPLATE: Dict[str, Any] = {
+    "name": " Title ",
+    "status": {"name": "Approved"},
+    "majorVersion": 1,
+    "minorVersion": 0,
+    "owner": {"fullname": "Owner"},
+    "approver": {"fullname": "Approver"},
+    "policyContributors": [],
+    "dataClassification": "",
+    "reviewDate": None,
+    "updatedate": None,
+    "sections": [{
+        "id": 1,
+        "title": "Section",
+        "description": _QUOTED_BODY,
+    }],
+}
+
+_PROCEDURE_TEMPLATE: Dict[str, Any] = {
+    "name": " Title ",
+    "status": {"name": "Approved"},
+    "majorVersion": 1,
+    "minorVersion": 0,
+    "owner": {"fullname": "Owner"},
+    "approver": {"fullname": "Approver"},
+    "procedureContributors": [],
+    "dataClassification": "",
+    "frequency": {"name": "Annual"},
+    "reviewDate": None,
+    "updatedate": None,
+    "description": _QUOTED_BODY,
+}
+
+
+def _make_policy_detail(doc_id: int = 1, code: str = "POL-1") -> dict:
+    return {**_POLICY_TEMPLATE, "id": doc_id, "policyCode": code}
+
+
+def _make_procedure_detail(doc_id: int = 1, code: str = "PRO-1") -> dict:
+    return {**_PROCEDURE_TEMPLATE, "id": doc_id, "procedureCode": code}
+
+
+# The exporters only read from the detail payloads, so each one is built once
+# per module and shared by every test that exports the default document.
+@pytest.fixture(scope="module")
+def policy_detail() -> dict:
+    return _make_policy_detail(1, "POL-1")
+
+
+@pytest.fixture(scope="module")
+def procedure_detail() -> dict:
+    return _make_procedure_detail(1, "PRO-1")
+
+
+@pytest.fixture(scope="module")
+def risk_detail() -> dict:
+    return _make_risk_detail(32, "RSK-1")
+
+
+def _file_names(directory: Path) -> Set[str]:
+    """Names of all entries in *directory*, read with a single ``scandir`` call."""
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries}
+
+
+@pytest.fixture(scope="session")
+def exporter_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Prototype output directory with the files the overwrite tests expect."""
+    template = tmp_path_factory.mktemp("exporter-template")
+    for name in ("existing.md", "a.md", "b.md"):
+        (template / name).touch()
+    return template
+
+
+@pytest.fixture
+def staged_dir(exporter_template: Path, tmp_path: Path) -> Path:
+    """Per-test copy of ``exporter_template`` so tests never share files."""
+    work = tmp_path / "work"
+    shutil.copytree(exporter_template, work)
+    return work
 
 
 class _Concrete(BaseExporter):
@@ -42,22 +144,111 @@ class _Concrete(BaseExporter):
         pass
 
 
+# BaseExporter's own helpers never touch the client.
+_UNUSED_CLIENT = cast(CtrlMapClient, sentinel.unused_client)
+
+
+@pytest.fixture
+def concrete(tmp_path: Path) -> _Concrete:
+    return _Concrete(_UNUSED_CLIENT, tmp_path)
+
+
+@pytest.fixture
+def staged_exporter(staged_dir: Path) -> _Concrete:
+    return _Concrete(_UNUSED_CLIENT, staged_dir)
+
+
 class TestBaseExporter:
     def test_cannot_instantiate(self) -> None:
         with pytest.raises(TypeError):
-            BaseExporter(MagicMock(), Path("/tmp/test"))  # type: ignore[abstract]
+            BaseExporter(_UNUSED_CLIENT, Path("/tmp/test"))  # type: ignore[abstract]
 
     def test_ensure_output_dir_creates_directory(self, tmp_path: Path) -> None:
-        exporter = _Concrete(MagicMock(), tmp_path / "nested" / "dir")
+        exporter = _Concrete(_UNUSED_CLIENT, tmp_path / "nested" / "dir")
         exporter._ensure_output_dir()
         assert (tmp_path / "nested" / "dir").is_dir()
 
-    def test_log_prints_to_stdout(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
-        exporter = _Concrete(MagicMock(), tmp_path)
-        exporter._log("hello world")
+    def test_log_prints_to_stdout(self, concrete: _Concrete, capsys: pytest.CaptureFixture[str]) -> None:
+        concrete._log("hello world")
         assert "hello world" in capsys.readouterr().out
 
 
+class TestFetchInOrder:
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    def test_yields_results_in_key_order(self, tmp_path: Path, concurrency: int) -> None:
+        exporter = _Concrete(_UNUSED_CLIENT, tmp_path, concurrency=concurrency)
+        keys = list(range(20))
+
+        assert list(exporter._fetch_in_order(lambda key: key * 10, keys)) == [key * 10 for key in keys]
+
+    def test_yields_in_key_order_when_later_keys_finish_first(self, tmp_path: Path) -> None:
+        last_fetched = threading.Event()
+        finished: List[int] = []
+
+        def fetch(key: int) -> int:
+            if key == 0:
+                assert last_fetched.wait(5)
+            elif key == 7:
+                last_fetched.set()
+            finished.append(key)
+            return key
+
+        exporter = _Concrete(_UNUSED_CLIENT, tmp_path, concurrency=4)
+
+        assert list(exporter._fetch_in_order(fetch, range(8))) == list(range(8))
+        assert finished[-1] == 0
+
+    def test_concurrent_fetch_errors_propagate(self, tmp_path: Path) -> None:
+        def fetch(key: int) -> int:
+            if key == 3:
+                raise ValueError("boom")
+            return key
+
+        exporter = _Concrete(_UNUSED_CLIENT, tmp_path, concurrency=4)
+        with pytest.raises(ValueError, match="boom"):
+            list(exporter._fetch_in_order(fetch, range(10)))
+
+    def test_failed_fetch_does_not_wait_for_requests_in_flight(self, tmp_path: Path) -> None:
+        release = threading.Event()
+
+        def fetch(key: int) -> int:
+            if key == 0:
+                raise ValueError("boom")
+            release.wait(5)
+            return key
+
+        exporter = _Concrete(_UNUSED_CLIENT, tmp_path, concurrency=4)
+        begin = time.monotonic()
+        try:
+            with pytest.raises(ValueError, match="boom"):
+                list(exporter._fetch_in_order(fetch, range(20)))
+            assert time.monotonic() - begin < 2
+        finally:
+            release.set()
+
+    def test_interrupt_does_not_wait_for_requests_in_flight(self, tmp_path: Path) -> None:
+        release = threading.Event()
+
+        def fetch(key: int) -> int:
+            if key:
+                release.wait(5)
+            return key
+
+        exporter = _Concrete(_UNUSED_CLIENT, tmp_path, concurrency=4)
+        results = cast(Generator[int, None, None], exporter._fetch_in_order(fetch, range(20)))
+        assert next(results) == 0
+        begin = time.monotonic()
+        try:
+            with pytest.raises(KeyboardInterrupt):
+                results.throw(KeyboardInterrupt())
+            assert time.monotonic() - begin < 2
+        finally:
+            release.set()
+
+    def test_concurrency_below_one_runs_sequentially(self, tmp_path: Path) -> None:
+        assert _Concrete(_UNUSED_CLIENT, tmp_path, concurrency=0).concurrency == 1
+
+
 class TestParseItemCode:
     def test_full_code(self) -> None:
         assert BaseExporter._parse_item_code("GOV-1", "GOV") == ("GOV-1", 1)
@@ -88,8 +279,7 @@ class TestReadLocalFrontmatter:
         (tmp_path / "GOV-2.md").write_text(
             "---\nid: GOV-2\ntitle: Second Doc\n---\n\n# GOV-2\n"
         )
-        exporter = _Concrete(MagicMock(), tmp_path)
-        result = exporter._read_local_frontmatter()
+        result = _Concrete(_UNUSED_CLIENT, tmp_path)._read_local_frontmatter()
         assert "GOV-1" in result
         assert result["GOV-1"]["title"] == "First Doc"
         assert "GOV-2" in result
@@ -98,222 +288,103 @@ class TestReadLocalFrontmatter:
     def test_excludes_index_md(self, tmp_path: Path) -> None:
         (tmp_path / "index.md").write_text("---\ngenerated: now\n---\n\n# Index\n")
         (tmp_path / "GOV-1.md").write_text("---\nid: GOV-1\n---\n\n# GOV-1\n")
-        exporter = _Concrete(MagicMock(), tmp_path)
-        result = exporter._read_local_frontmatter()
+        result = _Concrete(_UNUSED_CLIENT, tmp_path)._read_local_frontmatter()
         assert "index" not in result
         assert "GOV-1" in result
 
-    def test_empty_dir(self, tmp_path: Path) -> None:
-        exporter = _Concrete(MagicMock(), tmp_path)
-        assert exporter._read_local_frontmatter() == {}
+    def test_empty_dir(self, concrete: _Concrete) -> None:
+        assert concrete._read_local_frontmatter() == {}
 
     def test_nonexistent_dir(self, tmp_path: Path) -> None:
-        exporter = _Concrete(MagicMock(), tmp_path / "nonexistent")
+        exporter = _Concrete(_UNUSED_CLIENT, tmp_path / "nonexistent")
         assert exporter._read_local_frontmatter() == {}
 
     def test_skips_files_without_frontmatter(self, tmp_path: Path) -> None:
         (tmp_path / "GOV-1.md").write_text("# No frontmatter here\n")
-        exporter = _Concrete(MagicMock(), tmp_path)
-        assert exporter._read_local_frontmatter() == {}
+        assert _Concrete(_UNUSED_CLIENT, tmp_path)._read_local_frontmatter() == {}
 
 
 class TestBaseExporterOverwrite:
-    def test_should_write_returns_true_for_new_file(self, tmp_path: Path) -> None:
-        exporter = _Concrete(MagicMock(), tmp_path)
-        assert exporter._should_write(tmp_path / "new-file.md") is True
-
-    def test_should_write_returns_true_with_force(self, tmp_path: Path) -> None:
-        existing = tmp_path / "existing.md"
-        existing.write_text("content")
+    def test_should_write_returns_true_for_new_file(self, concrete: _Concrete) -> None:
+        assert concrete._should_write(concrete.output_dir / "new-file.md") is True
 
-        exporter = _Concrete(MagicMock(), tmp_path, force=True)
-        assert exporter._should_write(existing) is True
+    def test_should_write_returns_true_with_force(self, staged_dir: Path) -> None:
+        exporter = _Concrete(_UNUSED_CLIENT, staged_dir, force=True)
+        assert exporter._should_write(staged_dir / "existing.md") is True
 
-    def test_should_write_prompts_and_respects_no(self, tmp_path: Path) -> None:
-        existing = tmp_path / "existing.md"
-        existing.write_text("content")
-
-        exporter = _Concrete(MagicMock(), tmp_path)
+    def test_should_write_prompts_and_respects_no(self, staged_exporter: _Concrete) -> None:
         with patch("builtins.input", return_value="n"):
-            assert exporter._should_write(existing) is False
-
-    def test_should_write_prompts_and_respects_yes(self, tmp_path: Path) -> None:
-        existing = tmp_path / "existing.md"
-        existing.write_text("content")
+            assert staged_exporter._should_write(staged_exporter.output_dir / "existing.md") is False
 
-        exporter = _Concrete(MagicMock(), tmp_path)
+    def test_should_write_prompts_and_respects_yes(self, staged_exporter: _Concrete) -> None:
         with patch("builtins.input", return_value="y"):
-            assert exporter._should_write(existing) is True
+            assert staged_exporter._should_write(staged_exporter.output_dir / "existing.md") is True
 
-    def test_should_write_all_sets_overwrite_all(self, tmp_path: Path) -> None:
-        f1 = tmp_path / "a.md"
-        f2 = tmp_path / "b.md"
-        f1.write_text("a")
-        f2.write_text("b")
-
-        exporter = _Concrete(MagicMock(), tmp_path)
+    def test_should_write_all_sets_overwrite_all(self, staged_exporter: _Concrete) -> None:
+        out = staged_exporter.output_dir
         with patch("builtins.input", return_value="a") as mock_input:
-            assert exporter._should_write(f1) is True
-            assert exporter._should_write(f2) is True
+            assert staged_exporter._should_write(out / "a.md") is True
+            assert staged_exporter._should_write(out / "b.md") is True
 
         # Only prompted once — second call uses _overwrite_all
         assert mock_input.call_count == 1
 
+    def test_should_write_skips_stat_once_overwriting(self, staged_exporter: _Concrete) -> None:
+        staged_exporter._overwrite_all = True
+        with patch.object(Path, "exists") as mock_exists:
+            assert staged_exporter._should_write(staged_exporter.output_dir / "a.md") is True
+        mock_exists.assert_not_called()
 
-class TestPoliciesExporter:
-    """Basic smoke tests; see test_policies.py for comprehensive coverage."""
-
-    @staticmethod
-    def _setup_client(list_items: list, details: dict) -> MagicMock:
-        client = MagicMock()
-        client.list_policies.return_value = list_items
-        client.get_policy.side_effect = lambda policy_id: details.get(policy_id, {})
-        return client
-
-    @staticmethod
-    def _make_detail(doc_id: int = 1, code: str = "POL-1") -> dict:
-        from urllib.parse import quote
-        return {
-            "id": doc_id,
-            "policyCode": code,
-            "name": " Title ",
-            "status": {"name": "Approved"},
-            "majorVersion": 1,
-            "minorVersion": 0,
-            "owner": {"fullname": "Owner"},
-            "approver": {"fullname": "Approver"},
-            "policyContributors": [],
-            "dataClassification": "",
-            "reviewDate": None,
-            "updatedate": None,
-            "sections": [{
-                "id": 1,
-                "title": "Section",
-                "description": quote(quote("<p>Body.</p>", safe=""), safe=""),
-            }],
-        }
-
-    def test_export_calls_expected_endpoint_and_rule(self, tmp_path: Path) -> None:
-        client = self._setup_client(list_items=[], details={})
-
-        PoliciesExporter(client, tmp_path / "pols").export()
-
-        client.list_policies.assert_called_once_with()
-
-    def test_export_writes_md_only_by_default(self, tmp_path: Path) -> None:
-        detail = self._make_detail(1, "POL-1")
-        client = self._setup_client([{"id": 1}], {1: detail})
-
-        PoliciesExporter(client, tmp_path / "pols").export()
-
-        assert (tmp_path / "pols" / "POL-1.md").exists()
-        assert not (tmp_path / "pols" / "POL-1.json").exists()
-
-    def test_export_writes_json_with_keep_raw_json(self, tmp_path: Path) -> None:
-        detail = self._make_detail(1, "POL-1")
-        client = self._setup_client([{"id": 1}], {1: detail})
-
-        PoliciesExporter(client, tmp_path / "pols", keep_raw_json=True).export()
-
-        assert (tmp_path / "pols" / "POL-1.md").exists()
-        assert (tmp_path / "pols" / "POL-1.json").exists()
-
-
-class TestProceduresExporter:
-    """Basic smoke tests; see test_procedures.py for comprehensive coverage."""
-
-    @staticmethod
-    def _setup_client(list_items: list, details: dict) -> MagicMock:
-        client = MagicMock()
-        client.list_procedures.return_value = list_items
-        client.get_procedure.side_effect = lambda pid: details.get(pid, {})
-        client.get_procedure_controls.return_value = []
-        client.get_procedure_requirements.return_value = []
-        return client
-
-    @staticmethod
-    def _make_detail(doc_id: int = 1, code: str = "PRO-1") -> dict:
-        from urllib.parse import quote
-        return {
-            "id": doc_id,
-            "procedureCode": code,
-            "name": " Title ",
-            "status": {"name": "Approved"},
-            "majorVersion": 1,
-            "minorVersion": 0,
-            "owner": {"fullname": "Owner"},
-            "approver": {"fullname": "Approver"},
-            "procedureContributors": [],
-            "dataClassification": "",
-            "frequency": {"name": "Annual"},
-            "reviewDate": None,
-            "updatedate": None,
-            "description": quote(quote("<p>Body.</p>", safe=""), safe=""),
-        }
-
-    def test_export_calls_expected_endpoint(self, tmp_path: Path) -> None:
-        client = self._setup_client(list_items=[], details={})
-
-        ProceduresExporter(client, tmp_path / "pros").export()
-
-        client.list_procedures.assert_called_once_with()
 
-    def test_export_writes_md_only_by_default(self, tmp_path: Path) -> None:
-        detail = self._make_detail(1, "PRO-1")
-        client = self._setup_client([{"id": 1}], {1: detail})
+_SMOKE_CASES = [
+    pytest.param(PoliciesExporter, "list_policies", "policy_detail", "pols", 1, "POL-1", id="policies"),
+    pytest.param(ProceduresExporter, "list_procedures", "procedure_detail", "pros", 1, "PRO-1", id="procedures"),
+    pytest.param(RisksExporter, "list_risks", "risk_detail", "risks", 32, "RSK-1", id="risks"),
+]
 
-        ProceduresExporter(client, tmp_path / "pros").export()
-
-        assert (tmp_path / "pros" / "PRO-1.md").exists()
-        assert not (tmp_path / "pros" / "PRO-1.json").exists()
-        assert not list((tmp_path / "pros").glob("*.yaml"))
 
-    def test_export_writes_json_with_keep_raw_json(self, tmp_path: Path) -> None:
-        detail = self._make_detail(1, "PRO-1")
-        client = self._setup_client([{"id": 1}], {1: detail})
+@pytest.mark.parametrize("exporter_cls, list_method, detail_fixture, subdir, doc_id, code", _SMOKE_CASES)
+class TestExporterSmoke:
+    """Basic smoke tests; see the per-exporter test modules for comprehensive coverage."""
 
-        ProceduresExporter(client, tmp_path / "pros", keep_raw_json=True).export()
-
-        assert (tmp_path / "pros" / "PRO-1.md").exists()
-        assert (tmp_path / "pros" / "PRO-1.json").exists()
-
-
-class TestRisksExporter:
-    """Basic smoke tests; see test_risks.py for comprehensive coverage."""
-
-    @staticmethod
-    def _setup_client(list_items: list, details: dict) -> MagicMock:
-        client = MagicMock()
-        client.list_risks.return_value = {"riskDTOS": list_items}
-        client.get_risk.side_effect = lambda rid: details.get(rid, {})
-        client.get_risk_areas.return_value = []
-        return client
-
-    def test_export_calls_expected_endpoint(self, tmp_path: Path) -> None:
-        client = self._setup_client(list_items=[], details={})
-
-        RisksExporter(client, tmp_path / "risks").export()
-
-        client.list_risks.assert_called_once()
-
-    def test_export_writes_md_only_by_default(self, tmp_path: Path) -> None:
-        detail = _make_risk_detail(32, "RSK-1")
-        client = self._setup_client([{"id": 32}], {32: detail})
+    def test_export_calls_list_endpoint(
+        self,
+        tmp_path: Path,
+        exporter_cls: Type[BaseExporter],
+        list_method: str,
+        detail_fixture: str,
+        subdir: str,
+        doc_id: int,
+        code: str,
+    ) -> None:
+        client = MagicMock(wraps=FakeClient())
 
-        RisksExporter(client, tmp_path / "risks").export()
+        exporter_cls(client, tmp_path / subdir).export()
 
-        assert (tmp_path / "risks" / "RSK-1.md").exists()
-        assert not (tmp_path / "risks" / "RSK-1.json").exists()
-        assert not list((tmp_path / "risks").glob("*.yaml"))
+        getattr(client, list_method).assert_called_once_with()
 
-    def test_export_writes_json_with_keep_raw_json(self, tmp_path: Path) -> None:
-        detail = _make_risk_detail(32, "RSK-1")
-        client = self._setup_client([{"id": 32}], {32: detail})
+    @pytest.mark.parametrize("keep_raw_json", [False, True])
+    def test_export_writes_expected_files(
+        self,
+        request: pytest.FixtureRequest,
+        tmp_path: Path,
+        exporter_cls: Type[BaseExporter],
+        list_method: str,
+        detail_fixture: str,
+        subdir: str,
+        doc_id: int,
+        code: str,
+        keep_raw_json: bool,
+    ) -> None:
+        detail = request.getfixturevalue(detail_fixture)
+        client = FakeClient([{"id": doc_id}], {doc_id: detail})
 
-        RisksExporter(client, tmp_path / "risks", keep_raw_json=True).export()
+        exporter_cls(client, tmp_path / subdir, keep_raw_json=keep_raw_json).export()
 
-        assert (tmp_path / "risks" / "RSK-1.md").exists()
-        assert (tmp_path / "risks" / "RSK-1.json").exists()
+        expected = {f"{code}.md", "index.md"}
+        if keep_raw_json:
+            expected.add(f"{code}.json")
+        assert _file_names(tmp_path / subdir) == expected
 
 
 class TestExporterProgress:
@@ -321,12 +392,9 @@ class TestExporterProgress:
         self,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
+        risk_detail: dict,
     ) -> None:
-        detail = _make_risk_detail(32, "RSK-1")
-        client = MagicMock()
-        client.list_risks.return_value = {"riskDTOS": [{"id": 32}]}
-        client.get_risk.return_value = detail
-        client.get_risk_areas.return_value = []
+        client = FakeClient([{"id": 32}], {32: risk_detail})
 
         exporter = RisksExporter(client, tmp_path / "out")
         exporter.export()
@@ -336,173 +404,112 @@ class TestExporterProgress:
         assert "done (1 documents)" in out
 
 
-class TestCliExportWiring:
-    @staticmethod
-    def _setup_cli(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> MagicMock:
-        monkeypatch.chdir(tmp_path)
-        config = AppConfig(
-            api_url="https://api.eu.ctrlmap.com/",
-            bearer_token="token",
-            tenant_uri="dime2",
-        )
-        monkeypatch.setattr("ctrlmap_cli.cli.read_config", MagicMock(return_value=config))
-        client = MagicMock(name="client")
-        monkeypatch.setattr("ctrlmap_cli.cli.CtrlMapClient", MagicMock(return_value=client))
-        return client
-
-    def test_copy_govs_uses_governance_output_dir(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-        client = self._setup_cli(monkeypatch, tmp_path)
-        gov_instance = MagicMock()
-        gov_cls = MagicMock(return_value=gov_instance)
-
-        monkeypatch.setattr("ctrlmap_cli.cli.GovernanceExporter", gov_cls)
-        monkeypatch.setattr("ctrlmap_cli.cli.PoliciesExporter", MagicMock())
-        monkeypatch.setattr("ctrlmap_cli.cli.ProceduresExporter", MagicMock())
-        monkeypatch.setattr("ctrlmap_cli.cli.RisksExporter", MagicMock())
-
-        with patch("sys.argv", ["ctrlmap-cli", "--copy-govs"]):
-            from ctrlmap_cli.cli import main
-            main()
-
-        gov_cls.assert_called_once_with(
-            client, tmp_path / "govs", force=False, keep_raw_json=False,
-        )
-        gov_instance.export.assert_called_once()
+_EXPORTER_NAMES = (
+    "GovernanceExporter",
+    "PoliciesExporter",
+    "ProceduresExporter",
+    "RisksExporter",
+    "VendorsExporter",
+)
 
-    def test_copy_gov_single_calls_export_single(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-        client = self._setup_cli(monkeypatch, tmp_path)
-        gov_instance = MagicMock()
-        gov_cls = MagicMock(return_value=gov_instance)
 
-        monkeypatch.setattr("ctrlmap_cli.cli.GovernanceExporter", gov_cls)
+def _patch_all_exporters(monkeypatch: pytest.MonkeyPatch) -> Dict[str, MagicMock]:
+    """Replace every exporter class on ``ctrlmap_cli.cli`` with a mock, keyed by class name."""
+    mocks = {name: MagicMock(return_value=MagicMock()) for name in _EXPORTER_NAMES}
+    for name, mock in mocks.items():
+        monkeypatch.setattr(cli, name, mock)
+    return mocks
 
-        with patch("sys.argv", ["ctrlmap-cli", "--copy-gov", "GOV-1"]):
-            from ctrlmap_cli.cli import main
-            main()
 
-        gov_cls.assert_called_once_with(
-            client, tmp_path / "govs", force=False, keep_raw_json=False,
-        )
-        gov_instance.export_single.assert_called_once_with("GOV-1")
+class TestCliExportWiring:
+    @pytest.fixture(autouse=True)
+    def exporters(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Dict[str, MagicMock]:
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(cli, "read_config", lambda cwd: _CONFIG)
+        # The wiring tests only check that this exact object reaches the exporters.
+        monkeypatch.setattr(cli, "CtrlMapClient", lambda config: sentinel.client)
+        return _patch_all_exporters(monkeypatch)
 
-    def test_copy_all_runs_all_exporters_with_expected_dirs(
+    def test_copy_govs_uses_governance_output_dir(
         self,
         monkeypatch: pytest.MonkeyPatch,
         tmp_path: Path,
+        exporters: Dict[str, MagicMock],
     ) -> None:
-        client = self._setup_cli(monkeypatch, tmp_path)
-
-        gov_instance = MagicMock()
-        pol_instance = MagicMock()
-        pro_instance = MagicMock()
-        risk_instance = MagicMock()
-        vendor_instance = MagicMock()
-
-        gov_cls = MagicMock(return_value=gov_instance)
-        pol_cls = MagicMock(return_value=pol_instance)
-        pro_cls = MagicMock(return_value=pro_instance)
-        risk_cls = MagicMock(return_value=risk_instance)
-        vendor_cls = MagicMock(return_value=vendor_instance)
-
-        monkeypatch.setattr("ctrlmap_cli.cli.GovernanceExporter", gov_cls)
-        monkeypatch.setattr("ctrlmap_cli.cli.PoliciesExporter", pol_cls)
-        monkeypatch.setattr("ctrlmap_cli.cli.ProceduresExporter", pro_cls)
-        monkeypatch.setattr("ctrlmap_cli.cli.RisksExporter", risk_cls)
-        monkeypatch.setattr("ctrlmap_cli.cli.VendorsExporter", vendor_cls)
-
-        with patch("sys.argv", ["ctrlmap-cli", "--copy-all"]):
-            from ctrlmap_cli.cli import main
-            main()
-
-        kwargs = {"force": False, "keep_raw_json": False}
-        gov_cls.assert_called_once_with(client, tmp_path / "govs", **kwargs)
-        pol_cls.assert_called_once_with(client, tmp_path / "pols", **kwargs)
-        pro_cls.assert_called_once_with(client, tmp_path / "pros", **kwargs)
-        risk_cls.assert_called_once_with(client, tmp_path / "risks", **kwargs)
-        vendor_cls.assert_called_once_with(client, tmp_path / "vendors", **kwargs)
-
-        gov_instance.export.assert_called_once()
-        pol_instance.export.assert_called_once()
-        pro_instance.export.assert_called_once()
-        risk_instance.export.assert_called_once()
-        vendor_instance.export.assert_called_once()
+        gov_cls = exporters["GovernanceExporter"]
 
-    def test_force_and_keep_raw_json_passed_to_exporters(
+        monkeypatch.setattr(sys, "argv", ["ctrlmap-cli", "--copy-govs"])
+        cli.main()
+
+        gov_cls.assert_called_once_with(
+            sentinel.client, tmp_path / "govs", force=False, keep_raw_json=False, concurrency=8,
+        )
+        gov_cls.return_value.export.assert_called_once()
+
+    @pytest.mark.parametrize("flag, exporter_name, subdir, code", [
+        ("--copy-gov", "GovernanceExporter", "govs", "GOV-1"),
+        ("--copy-pol", "PoliciesExporter", "pols", "POL-4"),
+        ("--copy-pro", "ProceduresExporter", "pros", "PRO-3"),
+        ("--copy-risk", "RisksExporter", "risks", "RSK-5"),
+        ("--copy-vendor", "VendorsExporter", "vendors", "VND-17"),
+    ])
+    def test_singular_flag_calls_export_single(
         self,
         monkeypatch: pytest.MonkeyPatch,
         tmp_path: Path,
+        exporters: Dict[str, MagicMock],
+        flag: str,
+        exporter_name: str,
+        subdir: str,
+        code: str,
     ) -> None:
-        client = self._setup_cli(monkeypatch, tmp_path)
-        gov_cls = MagicMock(return_value=MagicMock())
-        monkeypatch.setattr("ctrlmap_cli.cli.GovernanceExporter", gov_cls)
-        monkeypatch.setattr("ctrlmap_cli.cli.PoliciesExporter", MagicMock())
-        monkeypatch.setattr("ctrlmap_cli.cli.ProceduresExporter", MagicMock())
-        monkeypatch.setattr("ctrlmap_cli.cli.RisksExporter", MagicMock())
+        exporter_cls = exporters[exporter_name]
 
-        with patch("sys.argv", ["ctrlmap-cli", "--copy-govs", "--force", "--keep-raw-json"]):
-            from ctrlmap_cli.cli import main
-            main()
+        monkeypatch.setattr(sys, "argv", ["ctrlmap-cli", flag, code])
+        cli.main()
 
-        gov_cls.assert_called_once_with(
-            client, tmp_path / "govs", force=True, keep_raw_json=True,
+        exporter_cls.assert_called_once_with(
+            sentinel.client, tmp_path / subdir, force=False, keep_raw_json=False, concurrency=8,
         )
+        exporter_cls.return_value.export_single.assert_called_once_with(code)
 
-    def test_copy_pro_singular_calls_export_single(
+    def test_copy_all_runs_all_exporters_with_expected_dirs(
         self,
         monkeypatch: pytest.MonkeyPatch,
         tmp_path: Path,
+        exporters: Dict[str, MagicMock],
     ) -> None:
-        client = self._setup_cli(monkeypatch, tmp_path)
-        pro_instance = MagicMock()
-        pro_cls = MagicMock(return_value=pro_instance)
-
-        monkeypatch.setattr("ctrlmap_cli.cli.ProceduresExporter", pro_cls)
+        monkeypatch.setattr(sys, "argv", ["ctrlmap-cli", "--copy-all"])
+        cli.main()
 
-        with patch("sys.argv", ["ctrlmap-cli", "--copy-pro", "PRO-3"]):
-            from ctrlmap_cli.cli import main
-            main()
-
-        pro_cls.assert_called_once_with(
-            client, tmp_path / "pros", force=False, keep_raw_json=False,
-        )
-        pro_instance.export_single.assert_called_once_with("PRO-3")
+        for name, subdir in zip(_EXPORTER_NAMES, ("govs", "pols", "pros", "risks", "vendors")):
+            exporters[name].assert_called_once_with(
+                sentinel.client, tmp_path / subdir, force=False, keep_raw_json=False, concurrency=8,
+            )
+            exporters[name].return_value.export.assert_called_once()
 
-    def test_copy_risk_singular_calls_export_single(
+    def test_force_and_keep_raw_json_passed_to_exporters(
         self,
         monkeypatch: pytest.MonkeyPatch,
         tmp_path: Path,
+        exporters: Dict[str, MagicMock],
     ) -> None:
-        client = self._setup_cli(monkeypatch, tmp_path)
-        risk_instance = MagicMock()
-        risk_cls = MagicMock(return_value=risk_instance)
-
-        monkeypatch.setattr("ctrlmap_cli.cli.RisksExporter", risk_cls)
-
-        with patch("sys.argv", ["ctrlmap-cli", "--copy-risk", "RSK-5"]):
-            from ctrlmap_cli.cli import main
-            main()
+        monkeypatch.setattr(sys, "argv", ["ctrlmap-cli", "--copy-govs", "--force", "--keep-raw-json"])
+        cli.main()
 
-        risk_cls.assert_called_once_with(
-            client, tmp_path / "risks", force=False, keep_raw_json=False,
+        exporters["GovernanceExporter"].assert_called_once_with(
+            sentinel.client, tmp_path / "govs", force=True, keep_raw_json=True, concurrency=8,
         )
-        risk_instance.export_single.assert_called_once_with("RSK-5")
 
-    def test_copy_vendor_singular_calls_export_single(
+    def test_concurrency_passed_to_exporters(
         self,
         monkeypatch: pytest.MonkeyPatch,
         tmp_path: Path,
+        exporters: Dict[str, MagicMock],
     ) -> None:
-        client = self._setup_cli(monkeypatch, tmp_path)
-        vendor_instance = MagicMock()
-        vendor_cls = MagicMock(return_value=vendor_instance)
-
-        monkeypatch.setattr("ctrlmap_cli.cli.VendorsExporter", vendor_cls)
-
-        with patch("sys.argv", ["ctrlmap-cli", "--copy-vendor", "VND-17"]):
-            from ctrlmap_cli.cli import main
-            main()
+        monkeypatch.setattr(sys, "argv", ["ctrlmap-cli", "--copy-risks", "--concurrency", "3"])
+        cli.main()
 
-        vendor_cls.assert_called_once_with(
-            client, tmp_path / "vendors", force=False, keep_raw_json=False,
+        exporters["RisksExporter"].assert_called_once_with(
+            sentinel.client, tmp_path / "risks", force=False, keep_raw_json=False, concurrency=3,
         )
-        vendor_instance.export_single.assert_called_once_with("VND-17")
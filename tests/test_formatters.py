@@ -1,9 +1,18 @@
 from __future__ import annotations
 
 import json
+import os
+import stat
+import sys
+import textwrap
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Dict
 
+import pytest
+import yaml
+
+from ctrlmap_cli.formatters.base import atomic_write
 from ctrlmap_cli.formatters.json_formatter import JsonFormatter
 from ctrlmap_cli.formatters.markdown_formatter import MarkdownFormatter
 
@@ -17,9 +26,7 @@ class TestJsonFormatter:
         path = tmp_path / "out.json"
         JsonFormatter().write(data, path)
 
-        content = path.read_text(encoding="utf-8")
-        parsed = json.loads(content)
-        assert parsed == data
+        assert json.loads(path.read_bytes()) == data
 
     def test_indent_and_no_ascii_escape(self, tmp_path: Path) -> None:
         data = {"title": "Ärger mit Ümlauten"}
@@ -99,6 +106,21 @@ class TestMarkdownFormatter:
         )
         assert "Über uns" in result
 
+    @pytest.mark.parametrize("frontmatter", [
+        {"id": "POL-4", "version": "1.2", "review_date": "2025-01-01", "owner": None, "draft": False},
+        {"title": "Scope: all sites", "note": "it's # not a comment", "code": "- x", "empty": ""},
+        {"contributors": ["Jane Doe", "yes", "null"], "controls": [], "meta": {}},
+        {"current_risk": {"score": 6, "level": "Medium", "likelihood_label": "Possible"}},
+        {"title": "Über uns — Richtlinie", "tags": ["ISO 27001"]},
+        {"title": "tab\tand\nbreak", "ratio": 1.5},
+        {"title": "a fairly long title that PyYAML folds once it runs past its eighty column width"},
+        {"nested": {"deeper": {"x": 1}}, "items": [{"a": 1}]},
+    ])
+    def test_frontmatter_matches_yaml_dump(self, frontmatter: Dict[str, Any]) -> None:
+        expected = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        result = MarkdownFormatter.render(title="", body="", frontmatter=frontmatter)
+        assert result == f"---\n{expected}---\n"
+
     def test_render_wraps_long_plain_lines(self) -> None:
         long_line = "word " * 40
         result = MarkdownFormatter.render(title="", body=long_line.strip())
@@ -106,6 +128,21 @@ class TestMarkdownFormatter:
         assert body_lines
         assert all(len(line) <= 120 for line in body_lines)
 
+    @pytest.mark.parametrize("line", [
+        " ".join(["lorem", "ipsum", "dolor"] * 30),
+        "short " + "x" * 130 + " tail " * 30,
+        "double  spaced " * 12,
+        "tab\tseparated " * 12,
+    ])
+    def test_render_wraps_like_textwrap(self, line: str) -> None:
+        expected = textwrap.fill(line, width=120, break_long_words=False, break_on_hyphens=False)
+        assert MarkdownFormatter.render(title="", body=line) == expected + "\n"
+
+    def test_render_leaves_fenced_lines_unwrapped(self) -> None:
+        long_line = "word " * 40
+        body = f"```markdown\n{long_line.strip()}\n```"
+        assert MarkdownFormatter.render(title="", body=body) == body + "\n"
+
     def test_render_preserves_inline_markdown_line(self) -> None:
         link_line = (
             "[A very long link that should remain untouched because markdown inline formatting is present]"
@@ -160,3 +197,58 @@ class TestMarkdownFormatter:
         content = path.read_text(encoding="utf-8")
         assert "document_id: DOC-7" in content
         assert "version: 2" in content
+
+
+class TestAtomicWrite:
+    def test_replaces_existing_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "doc.md"
+        path.write_text("old", encoding="utf-8")
+        atomic_write(path, "neu — ü\n")
+        assert path.read_text(encoding="utf-8") == "neu — ü\n"
+        assert os.listdir(tmp_path) == ["doc.md"]
+
+    def test_text_uses_platform_newlines(self, tmp_path: Path) -> None:
+        path = tmp_path / "doc.md"
+        atomic_write(path, "a\nb\n")
+        assert path.read_bytes() == f"a{os.linesep}b{os.linesep}".encode()
+
+    def test_unencodable_text_leaves_no_temp_file(self, tmp_path: Path) -> None:
+        with pytest.raises(UnicodeEncodeError):
+            atomic_write(tmp_path / "doc.md", "\ud800")
+        assert os.listdir(tmp_path) == []
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+    def test_keeps_permissions_of_existing_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "doc.md"
+        path.write_text("old", encoding="utf-8")
+        path.chmod(0o640)
+        atomic_write(path, "new")
+        assert path.read_text(encoding="utf-8") == "new"
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+    def test_symlink_updates_target(self, tmp_path: Path) -> None:
+        target = tmp_path / "real" / "doc.md"
+        target.parent.mkdir()
+        target.write_text("old", encoding="utf-8")
+        link = tmp_path / "doc.md"
+        try:
+            link.symlink_to(target)
+        except OSError:
+            pytest.skip("symlinks not supported")
+        atomic_write(link, "new")
+        assert link.is_symlink()
+        assert target.read_text(encoding="utf-8") == "new"
+        assert sorted(os.listdir(tmp_path / "real")) == ["doc.md"]
+
+    def test_writes_bytes(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.bin"
+        atomic_write(path, b"\x00\xff")
+        assert path.read_bytes() == b"\x00\xff"
+
+    def test_removes_temp_file_when_replace_fails(self, tmp_path: Path) -> None:
+        target = tmp_path / "taken"
+        target.mkdir()
+        (target / "child").touch()
+        with pytest.raises(OSError):
+            atomic_write(target, "data")
+        assert os.listdir(tmp_path) == ["taken"]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import json
+import threading
 from pathlib import Path
 from typing import Any, Dict, List
 from unittest.mock import MagicMock, patch
@@ -8,9 +10,12 @@ from urllib.parse import quote
 
 import pytest
 
+from ctrlmap_cli.exceptions import ItemNotFoundError
 from ctrlmap_cli.exporters.governance import GovernanceExporter
+from tests.conftest import FakeClient
 
 
+@functools.lru_cache(maxsize=128)
 def _double_encode(html: str) -> str:
     """Mimic the ControlMap double-URL-encoding."""
     return quote(quote(html, safe=""), safe="")
@@ -44,6 +49,9 @@ def _make_detail(
     }
 
 
+_DEFAULT_DETAIL = _make_detail()
+
+
 def _make_controls() -> List[Dict[str, Any]]:
     return [{"controlCode": "A.5.1"}, {"controlCode": "A.6.2"}]
 
@@ -52,43 +60,29 @@ def _make_requirements() -> List[Dict[str, Any]]:
     return [{"requirementCode": "ISO-1"}, {"requirementCode": "ISO-2"}]
 
 
-def _setup_client(
-    list_items: List[Dict[str, Any]],
-    details: Dict[int, Dict[str, Any]],
-    controls: Dict[int, List[Dict[str, Any]]],
-    requirements: Dict[int, List[Dict[str, Any]]],
-) -> MagicMock:
-    """Create a mock client that returns different data per endpoint."""
-    client = MagicMock()
+@pytest.fixture
+def client() -> FakeClient:
+    """Client serving the single default document GOV-1 (id 37)."""
+    return FakeClient([_make_list_item()], {37: _DEFAULT_DETAIL}, {37: []}, {37: []})
 
-    def fake_post(path: str, json: Any = None) -> Any:
-        if path == "/procedures":
-            return list_items
-        return []
 
-    def fake_get(path: str, params: Any = None) -> Any:
-        for doc_id, detail in details.items():
-            if path == f"/procedure/{doc_id}":
-                return detail
-            if path == f"/procedure/{doc_id}/controls":
-                return controls.get(doc_id, [])
-            if path == f"/procedure/{doc_id}/requirements":
-                return requirements.get(doc_id, [])
-        return []
-
-    client.post.side_effect = fake_post
-    client.get.side_effect = fake_get
-    return client
+@pytest.fixture(scope="module")
+def default_export(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """GOV-1.md as exported once from a document with controls and requirements."""
+    client = FakeClient(
+        [_make_list_item(37, "GOV-1")],
+        {37: _make_detail(37, "GOV-1", name=" My Gov Doc ")},
+        {37: _make_controls()},
+        {37: _make_requirements()},
+    )
+    govs = tmp_path_factory.mktemp("default_export") / "govs"
+    GovernanceExporter(client, govs).export()
+    return (govs / "GOV-1.md").read_text()
 
 
 class TestGovernanceExporterEndpoints:
     def test_list_call_uses_post_with_governance_filter(self, tmp_path: Path) -> None:
-        client = _setup_client(
-            list_items=[],
-            details={},
-            controls={},
-            requirements={},
-        )
+        client = MagicMock(wraps=FakeClient())
 
         GovernanceExporter(client, tmp_path / "govs").export()
 
@@ -101,24 +95,19 @@ class TestGovernanceExporterEndpoints:
         assert body["rules"][0]["field"] == "type"
         assert body["rules"][0]["value"] == "governance"
 
-    def test_fetches_list_then_detail_per_document(self, tmp_path: Path) -> None:
-        client = _setup_client(
-            list_items=[_make_list_item(37, "GOV-1")],
-            details={37: _make_detail(37, "GOV-1")},
-            controls={37: []},
-            requirements={37: []},
-        )
+    def test_fetches_list_then_detail_per_document(self, tmp_path: Path, client: FakeClient) -> None:
+        spy = MagicMock(wraps=client)
 
-        GovernanceExporter(client, tmp_path / "govs").export()
+        GovernanceExporter(spy, tmp_path / "govs").export()
 
-        assert client.post.call_count == 1
-        paths_called = [c.args[0] for c in client.get.call_args_list]
+        assert spy.post.call_count == 1
+        paths_called = [c.args[0] for c in spy.get.call_args_list]
         assert "/procedure/37" in paths_called
         assert "/procedure/37/controls" in paths_called
         assert "/procedure/37/requirements" in paths_called
 
     def test_empty_list_creates_index_only(self, tmp_path: Path) -> None:
-        client = _setup_client([], {}, {}, {})
+        client = FakeClient([], {}, {}, {})
 
         GovernanceExporter(client, tmp_path / "govs").export()
 
@@ -127,53 +116,41 @@ class TestGovernanceExporterEndpoints:
 
 
 class TestGovernanceExporterOutput:
-    def test_default_writes_md_only(self, tmp_path: Path) -> None:
-        client = _setup_client(
-            [_make_list_item(37, "GOV-1")],
-            {37: _make_detail(37, "GOV-1")},
-            {37: []},
-            {37: []},
-        )
-
+    def test_default_writes_md_only(self, tmp_path: Path, client: FakeClient) -> None:
         GovernanceExporter(client, tmp_path / "govs").export()
 
         assert (tmp_path / "govs" / "GOV-1.md").exists()
         assert not (tmp_path / "govs" / "GOV-1.json").exists()
         assert not (tmp_path / "govs" / "GOV-1.yaml").exists()
 
-    def test_keep_raw_json_writes_json(self, tmp_path: Path) -> None:
-        client = _setup_client(
-            [_make_list_item(37, "GOV-1")],
-            {37: _make_detail(37, "GOV-1")},
-            {37: []},
-            {37: []},
-        )
-
+    def test_keep_raw_json_writes_json(self, tmp_path: Path, client: FakeClient) -> None:
         GovernanceExporter(client, tmp_path / "govs", keep_raw_json=True).export()
 
         assert (tmp_path / "govs" / "GOV-1.md").exists()
         assert (tmp_path / "govs" / "GOV-1.json").exists()
         assert not (tmp_path / "govs" / "GOV-1.yaml").exists()
 
-    def test_markdown_has_frontmatter_and_title(self, tmp_path: Path) -> None:
-        client = _setup_client(
-            [_make_list_item(37, "GOV-1")],
-            {37: _make_detail(37, "GOV-1", name=" My Gov Doc ")},
-            {37: []},
-            {37: []},
-        )
-
-        GovernanceExporter(client, tmp_path / "govs").export()
-
-        content = (tmp_path / "govs" / "GOV-1.md").read_text()
-        assert content.startswith("---\n")
-        assert "# GOV-1 — My Gov Doc" in content
-        assert "id: GOV-1" in content
-        assert "status: Approved" in content
-        assert "version: '1.2'" in content or "version: \"1.2\"" in content
+    def test_markdown_starts_with_frontmatter(self, default_export: str) -> None:
+        assert default_export.startswith("---\n")
+
+    @pytest.mark.parametrize("needle", [
+        "# GOV-1 — My Gov Doc",
+        "id: GOV-1",
+        "status: Approved",
+        "version: '1.2'",
+        "owner: Jane Owner",
+        "approver: John Approver",
+        "- Alice Contrib",
+        "A.5.1",
+        "A.6.2",
+        "ISO-1",
+        "ISO-2",
+    ])
+    def test_markdown_contains(self, default_export: str, needle: str) -> None:
+        assert needle in default_export
 
     def test_markdown_body_is_converted_from_html(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(37, "GOV-1")],
             {37: _make_detail(37, "GOV-1", html_body="<h3>Section</h3><p>Content.</p>")},
             {37: []},
@@ -192,7 +169,7 @@ class TestGovernanceExporterOutput:
 
     def test_markdown_lines_are_max_120_chars(self, tmp_path: Path) -> None:
         long_html = "<p>" + ("word " * 70).strip() + "</p>"
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(37, "GOV-1")],
             {37: _make_detail(37, "GOV-1", html_body=long_html)},
             {37: []},
@@ -205,51 +182,8 @@ class TestGovernanceExporterOutput:
         for line in content.splitlines():
             assert len(line) <= 120
 
-    def test_frontmatter_includes_owner_and_approver(self, tmp_path: Path) -> None:
-        client = _setup_client(
-            [_make_list_item(37, "GOV-1")],
-            {37: _make_detail(37, "GOV-1")},
-            {37: []},
-            {37: []},
-        )
-
-        GovernanceExporter(client, tmp_path / "govs").export()
-
-        content = (tmp_path / "govs" / "GOV-1.md").read_text()
-        assert "owner: Jane Owner" in content
-        assert "approver: John Approver" in content
-
-    def test_frontmatter_includes_contributors(self, tmp_path: Path) -> None:
-        client = _setup_client(
-            [_make_list_item(37, "GOV-1")],
-            {37: _make_detail(37, "GOV-1")},
-            {37: []},
-            {37: []},
-        )
-
-        GovernanceExporter(client, tmp_path / "govs").export()
-
-        content = (tmp_path / "govs" / "GOV-1.md").read_text()
-        assert "Alice Contrib" in content
-
-    def test_frontmatter_includes_controls_and_requirements(self, tmp_path: Path) -> None:
-        client = _setup_client(
-            [_make_list_item(37, "GOV-1")],
-            {37: _make_detail(37, "GOV-1")},
-            {37: _make_controls()},
-            {37: _make_requirements()},
-        )
-
-        GovernanceExporter(client, tmp_path / "govs").export()
-
-        content = (tmp_path / "govs" / "GOV-1.md").read_text()
-        assert "A.5.1" in content
-        assert "A.6.2" in content
-        assert "ISO-1" in content
-        assert "ISO-2" in content
-
     def test_json_includes_all_fields(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(37, "GOV-1")],
             {37: _make_detail(37, "GOV-1")},
             {37: _make_controls()},
@@ -258,7 +192,7 @@ class TestGovernanceExporterOutput:
 
         GovernanceExporter(client, tmp_path / "govs", keep_raw_json=True).export()
 
-        parsed = json.loads((tmp_path / "govs" / "GOV-1.json").read_text())
+        parsed = json.loads((tmp_path / "govs" / "GOV-1.json").read_bytes())
         assert parsed["code"] == "GOV-1"
         assert parsed["version"] == "1.2"
         assert parsed["owner"] == "Jane Owner"
@@ -268,7 +202,7 @@ class TestGovernanceExporterOutput:
 
     def test_soft_hyphens_removed_from_body(self, tmp_path: Path) -> None:
         html = "<p>Infor\u00admations\u00adsicherheit</p>"
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(37, "GOV-1")],
             {37: _make_detail(37, "GOV-1", html_body=html)},
             {37: []},
@@ -290,7 +224,7 @@ class TestGovernanceExporterOutput:
             "reviewDate": "2027-05-01",
         }
 
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(37, "GOV-1")],
             {37: detail},
             {37: []},
@@ -305,7 +239,7 @@ class TestGovernanceExporterOutput:
 
 class TestGovernanceExporterIndex:
     def test_index_created(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(37, "GOV-1")],
             {37: _make_detail(37, "GOV-1", name=" Doc Title ")},
             {37: []},
@@ -319,14 +253,7 @@ class TestGovernanceExporterIndex:
         assert "[GOV-1](GOV-1.md)" in index
         assert "Doc Title" in index
 
-    def test_index_has_frontmatter(self, tmp_path: Path) -> None:
-        client = _setup_client(
-            [_make_list_item(37, "GOV-1")],
-            {37: _make_detail(37, "GOV-1")},
-            {37: []},
-            {37: []},
-        )
-
+    def test_index_has_frontmatter(self, tmp_path: Path, client: FakeClient) -> None:
         GovernanceExporter(client, tmp_path / "govs").export()
 
         index = (tmp_path / "govs" / "index.md").read_text()
@@ -334,14 +261,7 @@ class TestGovernanceExporterIndex:
         assert "document_count: 1" in index
         assert "generated:" in index
 
-    def test_index_lists_metadata(self, tmp_path: Path) -> None:
-        client = _setup_client(
-            [_make_list_item(37, "GOV-1")],
-            {37: _make_detail(37, "GOV-1")},
-            {37: []},
-            {37: []},
-        )
-
+    def test_index_lists_metadata(self, tmp_path: Path, client: FakeClient) -> None:
         GovernanceExporter(client, tmp_path / "govs").export()
 
         index = (tmp_path / "govs" / "index.md").read_text()
@@ -351,7 +271,7 @@ class TestGovernanceExporterIndex:
         assert "**Review Date:** 2027-01-07" in index
 
     def test_index_multiple_documents(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(37, "GOV-1"), _make_list_item(38, "GOV-2")],
             {
                 37: _make_detail(37, "GOV-1", name=" First "),
@@ -368,10 +288,40 @@ class TestGovernanceExporterIndex:
         assert "[GOV-1](GOV-1.md) — First" in index
         assert "[GOV-2](GOV-2.md) — Second" in index
 
+    def test_concurrent_export_keeps_list_order(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        codes = [f"GOV-{n}" for n in range(1, 9)]
+        fake = FakeClient(
+            [_make_list_item(100 + n, code) for n, code in enumerate(codes)],
+            {100 + n: _make_detail(100 + n, code) for n, code in enumerate(codes)},
+            {100 + n: [] for n in range(len(codes))},
+            {100 + n: [] for n in range(len(codes))},
+        )
+        # The first document only finishes after the last one has been fetched.
+        last_fetched = threading.Event()
+        serve = fake.get
+
+        def get(path: str, params: Any = None) -> Any:
+            if path == "/procedure/100":
+                assert last_fetched.wait(5)
+            elif path == "/procedure/107":
+                last_fetched.set()
+            return serve(path, params)
+
+        monkeypatch.setattr(fake, "get", get)
+
+        GovernanceExporter(fake, tmp_path / "govs", concurrency=4).export()
+
+        index = (tmp_path / "govs" / "index.md").read_text()
+        positions = [index.index(f"[{code}]({code}.md)") for code in codes]
+        assert positions == sorted(positions)
+        assert all((tmp_path / "govs" / f"{code}.md").exists() for code in codes)
+
 
 class TestGovernanceExporterProgress:
     def test_progress_output(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(37, "GOV-1"), _make_list_item(38, "GOV-2")],
             {
                 37: _make_detail(37, "GOV-1"),
@@ -390,7 +340,7 @@ class TestGovernanceExporterProgress:
         assert "2 documents" in output
 
     def test_empty_list_progress(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
-        client = _setup_client([], {}, {}, {})
+        client = FakeClient([], {}, {}, {})
 
         GovernanceExporter(client, tmp_path / "govs").export()
 
@@ -404,7 +354,7 @@ class TestGovernanceExporterEdgeCases:
         detail["approver"] = None
         detail["contributors"] = []
 
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(37, "GOV-1")],
             {37: detail},
             {37: []},
@@ -413,7 +363,7 @@ class TestGovernanceExporterEdgeCases:
 
         GovernanceExporter(client, tmp_path / "govs", keep_raw_json=True).export()
 
-        parsed = json.loads((tmp_path / "govs" / "GOV-1.json").read_text())
+        parsed = json.loads((tmp_path / "govs" / "GOV-1.json").read_bytes())
         assert parsed["owner"] == ""
         assert parsed["approver"] == ""
         assert parsed["contributors"] == []
@@ -423,7 +373,7 @@ class TestGovernanceExporterEdgeCases:
         del detail["majorVersion"]
         del detail["minorVersion"]
 
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(37, "GOV-1")],
             {37: detail},
             {37: []},
@@ -432,14 +382,14 @@ class TestGovernanceExporterEdgeCases:
 
         GovernanceExporter(client, tmp_path / "govs", keep_raw_json=True).export()
 
-        parsed = json.loads((tmp_path / "govs" / "GOV-1.json").read_text())
+        parsed = json.loads((tmp_path / "govs" / "GOV-1.json").read_bytes())
         assert parsed["version"] == "0.0"
 
     def test_empty_description(self, tmp_path: Path) -> None:
         detail = _make_detail(37, "GOV-1")
         detail["description"] = ""
 
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(37, "GOV-1")],
             {37: detail},
             {37: []},
@@ -448,14 +398,14 @@ class TestGovernanceExporterEdgeCases:
 
         GovernanceExporter(client, tmp_path / "govs", keep_raw_json=True).export()
 
-        parsed = json.loads((tmp_path / "govs" / "GOV-1.json").read_text())
+        parsed = json.loads((tmp_path / "govs" / "GOV-1.json").read_bytes())
         assert parsed["body_html"] == ""
         assert parsed["body_markdown"] == ""
 
 
 class TestGovernanceSingleExport:
     def test_export_single_by_full_code(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             list_items=[_make_list_item(37, "GOV-1"), _make_list_item(38, "GOV-2")],
             details={37: _make_detail(37, "GOV-1")},
             controls={37: _make_controls()},
@@ -468,22 +418,13 @@ class TestGovernanceSingleExport:
         content = (tmp_path / "govs" / "GOV-1.md").read_text()
         assert "# GOV-1 — Test Title" in content
 
-    def test_export_single_by_numeric_code(self, tmp_path: Path) -> None:
-        client = _setup_client(
-            list_items=[_make_list_item(37, "GOV-1")],
-            details={37: _make_detail(37, "GOV-1")},
-            controls={37: []},
-            requirements={37: []},
-        )
-
+    def test_export_single_by_numeric_code(self, tmp_path: Path, client: FakeClient) -> None:
         GovernanceExporter(client, tmp_path / "govs", force=True).export_single("1")
 
         assert (tmp_path / "govs" / "GOV-1.md").exists()
 
     def test_export_single_not_found_raises_error(self, tmp_path: Path) -> None:
-        from ctrlmap_cli.exceptions import ItemNotFoundError
-
-        client = _setup_client(
+        client = FakeClient(
             list_items=[_make_list_item(37, "GOV-1")],
             details={},
             controls={},
@@ -494,7 +435,7 @@ class TestGovernanceSingleExport:
             GovernanceExporter(client, tmp_path / "govs", force=True).export_single("GOV-99")
 
     def test_export_single_rebuilds_index(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             list_items=[_make_list_item(37, "GOV-1"), _make_list_item(38, "GOV-2")],
             details={37: _make_detail(37, "GOV-1")},
             controls={37: []},
@@ -517,7 +458,7 @@ class TestGovernanceSingleExport:
             "status: Draft\nclassification: Public\n---\n# GOV-2\n"
         )
 
-        client = _setup_client(
+        client = FakeClient(
             list_items=[_make_list_item(37, "GOV-1"), _make_list_item(38, "GOV-2")],
             details={37: _make_detail(37, "GOV-1")},
             controls={37: []},
@@ -532,15 +473,8 @@ class TestGovernanceSingleExport:
         assert "Bob" in index
 
     def test_export_single_progress_output(
-        self, tmp_path: Path, capsys: pytest.CaptureFixture[str],
+        self, tmp_path: Path, client: FakeClient, capsys: pytest.CaptureFixture[str],
     ) -> None:
-        client = _setup_client(
-            list_items=[_make_list_item(37, "GOV-1")],
-            details={37: _make_detail(37, "GOV-1")},
-            controls={37: []},
-            requirements={37: []},
-        )
-
         GovernanceExporter(client, tmp_path / "govs", force=True).export_single("GOV-1")
 
         output = capsys.readouterr().out
@@ -549,53 +483,32 @@ class TestGovernanceSingleExport:
 
 
 class TestGovernanceOverwrite:
-    def test_force_overwrites_without_prompt(self, tmp_path: Path) -> None:
+    def test_force_overwrites_without_prompt(self, tmp_path: Path, client: FakeClient) -> None:
         govs = tmp_path / "govs"
         govs.mkdir()
         (govs / "GOV-1.md").write_text("old content")
 
-        client = _setup_client(
-            [_make_list_item(37, "GOV-1")],
-            {37: _make_detail(37, "GOV-1")},
-            {37: []},
-            {37: []},
-        )
-
         GovernanceExporter(client, govs, force=True).export()
 
         content = (govs / "GOV-1.md").read_text()
         assert content != "old content"
         assert "# GOV-1" in content
 
-    def test_prompt_no_skips_file(self, tmp_path: Path) -> None:
+    def test_prompt_no_skips_file(self, tmp_path: Path, client: FakeClient) -> None:
         govs = tmp_path / "govs"
         govs.mkdir()
         (govs / "GOV-1.md").write_text("old content")
 
-        client = _setup_client(
-            [_make_list_item(37, "GOV-1")],
-            {37: _make_detail(37, "GOV-1")},
-            {37: []},
-            {37: []},
-        )
-
         with patch("builtins.input", return_value="n"):
             GovernanceExporter(client, govs).export()
 
         assert (govs / "GOV-1.md").read_text() == "old content"
 
-    def test_prompt_yes_overwrites(self, tmp_path: Path) -> None:
+    def test_prompt_yes_overwrites(self, tmp_path: Path, client: FakeClient) -> None:
         govs = tmp_path / "govs"
         govs.mkdir()
         (govs / "GOV-1.md").write_text("old content")
 
-        client = _setup_client(
-            [_make_list_item(37, "GOV-1")],
-            {37: _make_detail(37, "GOV-1")},
-            {37: []},
-            {37: []},
-        )
-
         with patch("builtins.input", return_value="y"):
             GovernanceExporter(client, govs).export()
 
@@ -609,7 +522,7 @@ class TestGovernanceOverwrite:
         (govs / "GOV-2.md").write_text("old2")
         (govs / "index.md").write_text("old index")
 
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(37, "GOV-1"), _make_list_item(38, "GOV-2")],
             {
                 37: _make_detail(37, "GOV-1"),
@@ -627,14 +540,7 @@ class TestGovernanceOverwrite:
         assert "# GOV-1" in (govs / "GOV-1.md").read_text()
         assert "# GOV-2" in (govs / "GOV-2.md").read_text()
 
-    def test_new_files_written_without_prompt(self, tmp_path: Path) -> None:
-        client = _setup_client(
-            [_make_list_item(37, "GOV-1")],
-            {37: _make_detail(37, "GOV-1")},
-            {37: []},
-            {37: []},
-        )
-
+    def test_new_files_written_without_prompt(self, tmp_path: Path, client: FakeClient) -> None:
         with patch("builtins.input") as mock_input:
             GovernanceExporter(client, tmp_path / "govs").export()
 
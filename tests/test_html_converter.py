@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from urllib.parse import quote
+import textwrap
+from urllib.parse import quote, unquote
 
+import pytest
+
+from ctrlmap_cli import html_converter
 from ctrlmap_cli.html_converter import (
     decode_description,
     html_to_markdown,
@@ -37,6 +41,23 @@ class TestDecodeDescription:
         double = quote(quote(html, safe=""), safe="")
         assert "Ärger" in decode_description(double)
 
+    @pytest.mark.parametrize("encoded", [
+        "100%",
+        "50%zz off",
+        "a=b%253D",
+        "line%0Abreak%250A",
+        "%C3%25A4",
+        "Ärger%2520",
+        "%25",
+        "%2",
+    ])
+    def test_matches_unquote_on_irregular_input(self, encoded: str) -> None:
+        assert decode_description(encoded) == unquote(unquote(encoded))
+
+    def test_percent_and_equals_in_body(self) -> None:
+        html = '<p style="width: 100%">a = b, 50% off</p>\r\n'
+        assert decode_description(quote(quote(html, safe=""), safe="")) == html
+
 
 class TestHtmlToMarkdown:
     def test_basic_paragraph(self) -> None:
@@ -92,11 +113,66 @@ class TestHtmlToMarkdown:
         result = html_to_markdown('<p><a href="https://example.com">link</a></p>')
         assert "[link](https://example.com)" in result
 
+    def test_nested_list_markers(self) -> None:
+        html = "<ul><li>A<ul><li>B</li></ul></li><li>C</li></ul>"
+        assert html_to_markdown(html) == "* A\n  + B\n* C"
+
+    def test_ordered_list_numbering(self) -> None:
+        assert html_to_markdown('<ol start="3"><li>One</li><li>Two</li></ol>') == "3. One\n4. Two"
+
+    def test_markdown_characters_escaped(self) -> None:
+        assert html_to_markdown("<p>snake_case * star</p>") == r"snake\_case \* star"
+
+    def test_code_not_escaped(self) -> None:
+        result = html_to_markdown("<p><code>snake_case</code></p><pre>a_b\n  c*d</pre>")
+        assert result == "`snake_case`\n\n```\na_b\n  c*d\n```"
+
+    def test_line_break(self) -> None:
+        assert html_to_markdown("<p>first<br>second</p>") == "first\nsecond"
+
+    def test_blockquote(self) -> None:
+        assert html_to_markdown("<blockquote><p>Quoted</p></blockquote>") == "> Quoted"
+
+    def test_autolink(self) -> None:
+        result = html_to_markdown('<p><a href="https://example.com">https://example.com</a></p>')
+        assert result == "<https://example.com>"
+
+    def test_unclosed_and_stray_tags_tolerated(self) -> None:
+        assert html_to_markdown("<p><strong>bold</p></em>after") == "**bold**\n\nafter"
+
+    def test_entities_decoded(self) -> None:
+        assert html_to_markdown("<p>a &amp; b &lt;c&gt;</p><!-- note -->") == "a & b <c>"
+
     def test_wraps_long_plain_lines_to_120(self) -> None:
         long_text = " ".join(["word"] * 80)
         result = html_to_markdown(f"<p>{long_text}</p>")
         assert all(len(line) <= 120 for line in result.splitlines() if line)
 
+    @pytest.mark.parametrize("text", [
+        "  snake_case\t\t* star  ",
+        "line one \r\n\r\n  line two­",
+        " ".join(["word"] * 80),
+    ])
+    def test_tagless_text_matches_wrapped_paragraph(self, text: str) -> None:
+        assert html_to_markdown(text) == html_to_markdown(f"<p>{text}</p>")
+
+
+class TestConversionCache:
+    def test_repeated_input_served_from_cache(self) -> None:
+        html = "<p>Cached <strong>boilerplate</strong> paragraph.</p>"
+        first = html_to_markdown(html)
+        hits = html_converter._convert_html_cached.cache_info().hits
+        assert html_to_markdown(html) == first
+        assert html_converter._convert_html_cached.cache_info().hits == hits + 1
+
+    def test_large_input_bypasses_cache(self) -> None:
+        html = "<p>" + "word " * (html_converter._CACHE_MAX_INPUT_LENGTH // 5) + "</p>"
+        before = html_converter._convert_html_cached.cache_info()
+        result = html_to_markdown(html)
+        after = html_converter._convert_html_cached.cache_info()
+        assert result.startswith("word word")
+        assert (after.hits, after.misses) == (before.hits, before.misses)
+
 
 class TestStrongNbspWhitespace:
     def test_strong_nbsp_becomes_space(self) -> None:
@@ -122,6 +198,10 @@ class TestStrongNbspWhitespace:
         result = html_to_markdown(html)
         assert "dimedis GmbH hat" in result
 
+    @pytest.mark.parametrize("spacer", ["&nbsp;&nbsp;", " &nbsp; ", "&#160;", "&#xA0;", "\u00a0"])
+    def test_whitespace_only_bold_variants_become_space(self, spacer: str) -> None:
+        assert html_to_markdown(f"<p>a<STRONG>{spacer}</STRONG>b</p>") == "a b"
+
     def test_real_gov1_pattern(self) -> None:
         html = "<p>dimedis<strong>&nbsp;</strong>unterhält Beziehungen.</p>"
         result = html_to_markdown(html)
@@ -167,6 +247,20 @@ class TestLineWrapping:
         for line in result.splitlines():
             assert len(line) <= 120
 
+    @pytest.mark.parametrize("html,indent", [
+        ("<p>" + " ".join(["lorem", "ipsum"] * 40) + " " + "x" * 130 + " tail</p>", ""),
+        ("<ul><li>" + " ".join(["item"] * 60) + "</li></ul>", "  "),
+    ])
+    def test_wrapping_matches_textwrap(self, html: str, indent: str) -> None:
+        result = html_to_markdown(html)
+        first, *rest = result.splitlines()
+        text = " ".join([first] + [line[len(indent):] for line in rest])
+        expected = textwrap.wrap(
+            text, width=120, subsequent_indent=indent,
+            break_long_words=False, break_on_hyphens=False,
+        )
+        assert result.splitlines() == expected
+
     def test_list_continuation_indented(self) -> None:
         long_value = " ".join(["value"] * 25)
         html = f"<ul><li>{long_value}</li></ul>"
@@ -350,6 +444,10 @@ class TestShiftHeadings:
         md = "Use #channel for updates."
         assert shift_headings(md, 1) == md
 
+    def test_line_breaks_normalized_like_line_by_line(self) -> None:
+        md = "## A\r\nText\r\n#\n###\tB\n"
+        assert shift_headings(md, 1) == "### A\nText\n#\n#### B"
+
 
 class TestNormalizeHeadings:
     def test_h3_h4_to_h2_h3(self) -> None:
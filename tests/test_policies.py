@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from unittest.mock import MagicMock, patch
@@ -8,7 +9,9 @@ from urllib.parse import quote
 
 import pytest
 
+from ctrlmap_cli.exceptions import ItemNotFoundError
 from ctrlmap_cli.exporters.policies import PoliciesExporter
+from tests.conftest import FakeClient
 
 
 def _double_encode(html: str) -> str:
@@ -58,34 +61,19 @@ def _make_detail(
     }
 
 
-def _setup_client(
-    list_items: List[Dict[str, Any]],
-    details: Dict[int, Dict[str, Any]],
-) -> MagicMock:
-    client = MagicMock()
-
-    client.list_policies.return_value = list_items
-
-    def fake_get_policy(policy_id: int) -> Any:
-        return details.get(policy_id, {})
-
-    client.get_policy.side_effect = fake_get_policy
-    return client
-
-
 class TestPoliciesExporterEndpoints:
     def test_list_call_uses_post_with_policy_filter(self, tmp_path: Path) -> None:
-        client = _setup_client(list_items=[], details={})
+        client = MagicMock(wraps=FakeClient(list_items=[], details={}))
 
         PoliciesExporter(client, tmp_path / "pols").export()
 
         client.list_policies.assert_called_once_with()
 
     def test_fetches_detail_per_document(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = MagicMock(wraps=FakeClient(
             list_items=[_make_list_item(10, "POL-4")],
             details={10: _make_detail(10, "POL-4")},
-        )
+        ))
 
         PoliciesExporter(client, tmp_path / "pols").export()
 
@@ -93,7 +81,7 @@ class TestPoliciesExporterEndpoints:
         client.get_policy.assert_called_once_with(10)
 
     def test_empty_list_creates_index_only(self, tmp_path: Path) -> None:
-        client = _setup_client([], {})
+        client = FakeClient([], {})
 
         PoliciesExporter(client, tmp_path / "pols").export()
 
@@ -103,7 +91,7 @@ class TestPoliciesExporterEndpoints:
 
 class TestPoliciesExporterOutput:
     def test_default_writes_md_only(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: _make_detail(10, "POL-4")},
         )
@@ -114,7 +102,7 @@ class TestPoliciesExporterOutput:
         assert not (tmp_path / "pols" / "POL-4.json").exists()
 
     def test_keep_raw_json_writes_json(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: _make_detail(10, "POL-4")},
         )
@@ -125,7 +113,7 @@ class TestPoliciesExporterOutput:
         assert (tmp_path / "pols" / "POL-4.json").exists()
 
     def test_markdown_has_frontmatter_and_title(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: _make_detail(10, "POL-4", name=" My Policy ")},
         )
@@ -140,7 +128,7 @@ class TestPoliciesExporterOutput:
         assert "version: '2.0'" in content or 'version: "2.0"' in content
 
     def test_frontmatter_includes_owner_and_approver(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: _make_detail(10, "POL-4")},
         )
@@ -152,7 +140,7 @@ class TestPoliciesExporterOutput:
         assert "approver: John Approver" in content
 
     def test_frontmatter_includes_contributors(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: _make_detail(10, "POL-4")},
         )
@@ -163,7 +151,7 @@ class TestPoliciesExporterOutput:
         assert "Alice Contrib" in content
 
     def test_frontmatter_includes_classification(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: _make_detail(10, "POL-4")},
         )
@@ -174,7 +162,7 @@ class TestPoliciesExporterOutput:
         assert "classification: Intern" in content
 
     def test_frontmatter_includes_review_date(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: _make_detail(10, "POL-4")},
         )
@@ -186,7 +174,7 @@ class TestPoliciesExporterOutput:
 
     def test_markdown_body_is_converted_from_html(self, tmp_path: Path) -> None:
         section = _make_section(1, "Section One", "<h3>Topic</h3><p>Content.</p>")
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: _make_detail(10, "POL-4", sections=[section])},
         )
@@ -200,14 +188,14 @@ class TestPoliciesExporterOutput:
         assert "%25" not in content
 
     def test_json_includes_all_fields(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: _make_detail(10, "POL-4")},
         )
 
         PoliciesExporter(client, tmp_path / "pols", keep_raw_json=True).export()
 
-        parsed = json.loads((tmp_path / "pols" / "POL-4.json").read_text())
+        parsed = json.loads((tmp_path / "pols" / "POL-4.json").read_bytes())
         assert parsed["code"] == "POL-4"
         assert parsed["version"] == "2.0"
         assert parsed["owner"] == "Jane Owner"
@@ -224,7 +212,7 @@ class TestPoliciesSections:
             _make_section(1, "Scope", "<p>Scope content.</p>"),
             _make_section(2, "Purpose", "<p>Purpose content.</p>"),
         ]
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: _make_detail(10, "POL-4", sections=sections)},
         )
@@ -242,7 +230,7 @@ class TestPoliciesSections:
         sections = [
             _make_section(1, "Test Policy", "<h3>1. Zweck</h3><p>Purpose.</p>"),
         ]
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: _make_detail(10, "POL-4", name="Test Policy", sections=sections)},
         )
@@ -270,7 +258,7 @@ class TestPoliciesSections:
             {"id": 1, "title": "Scope", "description": _double_encode("<h4>Sub topic</h4><p>Details.</p>")},
             {"id": 2, "title": "Purpose", "description": _double_encode("<p>More.</p>")},
         ]
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: detail},
         )
@@ -282,7 +270,7 @@ class TestPoliciesSections:
         assert "### Sub topic" in content
 
     def test_empty_sections(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: _make_detail(10, "POL-4", sections=[])},
         )
@@ -295,7 +283,7 @@ class TestPoliciesSections:
 
 class TestPoliciesIndex:
     def test_index_created(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: _make_detail(10, "POL-4", name=" My Policy ")},
         )
@@ -308,7 +296,7 @@ class TestPoliciesIndex:
         assert "My Policy" in index
 
     def test_index_has_frontmatter(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: _make_detail(10, "POL-4")},
         )
@@ -321,7 +309,7 @@ class TestPoliciesIndex:
         assert "generated:" in index
 
     def test_index_lists_metadata(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: _make_detail(10, "POL-4")},
         )
@@ -335,7 +323,7 @@ class TestPoliciesIndex:
         assert "**Review Date:** 2027-06-15" in index
 
     def test_index_contains_summary_line(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4"), _make_list_item(11, "POL-5")],
             {
                 10: _make_detail(10, "POL-4"),
@@ -349,7 +337,7 @@ class TestPoliciesIndex:
         assert "2 policies exported on " in index
 
     def test_index_multiple_documents(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4"), _make_list_item(11, "POL-5")],
             {
                 10: _make_detail(10, "POL-4", name=" First "),
@@ -367,7 +355,7 @@ class TestPoliciesIndex:
     def test_index_contains_all_policy_codes_as_links(self, tmp_path: Path) -> None:
         items = [_make_list_item(i, f"POL-{i}") for i in range(1, 4)]
         details = {i: _make_detail(i, f"POL-{i}") for i in range(1, 4)}
-        client = _setup_client(items, details)
+        client = FakeClient(items, details)
 
         PoliciesExporter(client, tmp_path / "pols").export()
 
@@ -375,10 +363,36 @@ class TestPoliciesIndex:
         for i in range(1, 4):
             assert f"[POL-{i}](POL-{i}.md)" in index
 
+    def test_concurrent_export_keeps_list_order(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        items = [_make_list_item(i, f"POL-{i}") for i in range(1, 9)]
+        details = {i: _make_detail(i, f"POL-{i}") for i in range(1, 9)}
+        fake = FakeClient(items, details)
+        # The first policy only finishes after the last one has been fetched.
+        last_fetched = threading.Event()
+        serve = fake.get_policy
+
+        def get_policy(policy_id: int) -> Dict[str, Any]:
+            if policy_id == 1:
+                assert last_fetched.wait(5)
+            elif policy_id == 8:
+                last_fetched.set()
+            return serve(policy_id)
+
+        monkeypatch.setattr(fake, "get_policy", get_policy)
+
+        PoliciesExporter(fake, tmp_path / "pols", concurrency=4).export()
+
+        index = (tmp_path / "pols" / "index.md").read_text()
+        positions = [index.index(f"[POL-{i}](POL-{i}.md)") for i in range(1, 9)]
+        assert positions == sorted(positions)
+        assert all((tmp_path / "pols" / f"POL-{i}.md").exists() for i in range(1, 9))
+
 
 class TestPoliciesProgress:
     def test_progress_output(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4"), _make_list_item(11, "POL-5")],
             {
                 10: _make_detail(10, "POL-4"),
@@ -395,7 +409,7 @@ class TestPoliciesProgress:
         assert "2 documents" in output
 
     def test_empty_list_progress(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
-        client = _setup_client([], {})
+        client = FakeClient([], {})
 
         PoliciesExporter(client, tmp_path / "pols").export()
 
@@ -409,14 +423,14 @@ class TestPoliciesEdgeCases:
         detail["approver"] = None
         detail["policyContributors"] = []
 
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: detail},
         )
 
         PoliciesExporter(client, tmp_path / "pols", keep_raw_json=True).export()
 
-        parsed = json.loads((tmp_path / "pols" / "POL-4.json").read_text())
+        parsed = json.loads((tmp_path / "pols" / "POL-4.json").read_bytes())
         assert parsed["owner"] == ""
         assert parsed["approver"] == ""
         assert parsed["contributors"] == []
@@ -426,19 +440,19 @@ class TestPoliciesEdgeCases:
         del detail["majorVersion"]
         del detail["minorVersion"]
 
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: detail},
         )
 
         PoliciesExporter(client, tmp_path / "pols", keep_raw_json=True).export()
 
-        parsed = json.loads((tmp_path / "pols" / "POL-4.json").read_text())
+        parsed = json.loads((tmp_path / "pols" / "POL-4.json").read_bytes())
         assert parsed["version"] == "0.0"
 
     def test_empty_description_in_section(self, tmp_path: Path) -> None:
         section = {"id": 1, "title": "Empty", "description": ""}
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: _make_detail(10, "POL-4", sections=[section])},
         )
@@ -449,7 +463,7 @@ class TestPoliciesEdgeCases:
 
     def test_fallback_filename_without_code(self, tmp_path: Path) -> None:
         detail = _make_detail(10, "", name="Unnamed Policy")
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "")],
             {10: detail},
         )
@@ -459,7 +473,7 @@ class TestPoliciesEdgeCases:
         assert (tmp_path / "pols" / "POL-10.md").exists()
 
     def test_updated_date_truncated_to_date_only(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: _make_detail(10, "POL-4")},
         )
@@ -472,7 +486,7 @@ class TestPoliciesEdgeCases:
 
 class TestPoliciesSingleExport:
     def test_export_single_by_full_code(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             list_items=[_make_list_item(10, "POL-4"), _make_list_item(11, "POL-5")],
             details={10: _make_detail(10, "POL-4")},
         )
@@ -484,7 +498,7 @@ class TestPoliciesSingleExport:
         assert "# POL-4 — Test Policy" in content
 
     def test_export_single_by_numeric_code(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             list_items=[_make_list_item(10, "POL-4")],
             details={10: _make_detail(10, "POL-4")},
         )
@@ -494,9 +508,7 @@ class TestPoliciesSingleExport:
         assert (tmp_path / "pols" / "POL-4.md").exists()
 
     def test_export_single_not_found_raises_error(self, tmp_path: Path) -> None:
-        from ctrlmap_cli.exceptions import ItemNotFoundError
-
-        client = _setup_client(
+        client = FakeClient(
             list_items=[_make_list_item(10, "POL-4")],
             details={},
         )
@@ -505,7 +517,7 @@ class TestPoliciesSingleExport:
             PoliciesExporter(client, tmp_path / "pols", force=True).export_single("POL-99")
 
     def test_export_single_rebuilds_index(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             list_items=[_make_list_item(10, "POL-4"), _make_list_item(11, "POL-5")],
             details={10: _make_detail(10, "POL-4")},
         )
@@ -525,7 +537,7 @@ class TestPoliciesSingleExport:
             "status: Draft\nclassification: Public\n---\n# POL-5\n"
         )
 
-        client = _setup_client(
+        client = FakeClient(
             list_items=[_make_list_item(10, "POL-4"), _make_list_item(11, "POL-5")],
             details={10: _make_detail(10, "POL-4")},
         )
@@ -539,7 +551,7 @@ class TestPoliciesSingleExport:
     def test_export_single_progress_output(
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str],
     ) -> None:
-        client = _setup_client(
+        client = FakeClient(
             list_items=[_make_list_item(10, "POL-4")],
             details={10: _make_detail(10, "POL-4")},
         )
@@ -557,7 +569,7 @@ class TestPoliciesOverwrite:
         pols.mkdir()
         (pols / "POL-4.md").write_text("old content")
 
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: _make_detail(10, "POL-4")},
         )
@@ -573,7 +585,7 @@ class TestPoliciesOverwrite:
         pols.mkdir()
         (pols / "POL-4.md").write_text("old content")
 
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: _make_detail(10, "POL-4")},
         )
@@ -584,7 +596,7 @@ class TestPoliciesOverwrite:
         assert (pols / "POL-4.md").read_text() == "old content"
 
     def test_new_files_written_without_prompt(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: _make_detail(10, "POL-4")},
         )
@@ -600,7 +612,7 @@ class TestPoliciesOverwrite:
         pols.mkdir()
         (pols / "index.md").write_text("old index")
 
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(10, "POL-4")],
             {10: _make_detail(10, "POL-4")},
         )
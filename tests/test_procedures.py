@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List
 from unittest.mock import MagicMock, patch
 from urllib.parse import quote
 
 import pytest
 
+from ctrlmap_cli.exceptions import ItemNotFoundError
 from ctrlmap_cli.exporters.procedures import ProceduresExporter
+from tests.conftest import FakeClient
 
 
 def _double_encode(html: str) -> str:
@@ -51,38 +53,19 @@ def _make_requirements() -> List[Dict[str, Any]]:
     return [{"requirementCode": "ISO-1"}, {"requirementCode": "ISO-2"}]
 
 
-def _setup_client(
-    list_items: List[Dict[str, Any]],
-    details: Dict[int, Dict[str, Any]],
-    controls: Optional[Dict[int, List[Dict[str, Any]]]] = None,
-    requirements: Optional[Dict[int, List[Dict[str, Any]]]] = None,
-) -> MagicMock:
-    if controls is None:
-        controls = {}
-    if requirements is None:
-        requirements = {}
-
-    client = MagicMock()
-    client.list_procedures.return_value = list_items
-    client.get_procedure.side_effect = lambda pid: details.get(pid, {})
-    client.get_procedure_controls.side_effect = lambda pid: controls.get(pid, [])
-    client.get_procedure_requirements.side_effect = lambda pid: requirements.get(pid, [])
-    return client
-
-
 class TestProceduresExporterEndpoints:
     def test_list_call_uses_list_procedures(self, tmp_path: Path) -> None:
-        client = _setup_client(list_items=[], details={})
+        client = MagicMock(wraps=FakeClient(list_items=[], details={}))
 
         ProceduresExporter(client, tmp_path / "pros").export()
 
         client.list_procedures.assert_called_once_with()
 
     def test_fetches_detail_per_document(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = MagicMock(wraps=FakeClient(
             list_items=[_make_list_item(28, "PRO-3")],
             details={28: _make_detail(28, "PRO-3")},
-        )
+        ))
 
         ProceduresExporter(client, tmp_path / "pros").export()
 
@@ -92,7 +75,7 @@ class TestProceduresExporterEndpoints:
         client.get_procedure_requirements.assert_called_once_with(28)
 
     def test_empty_list_creates_index_only(self, tmp_path: Path) -> None:
-        client = _setup_client([], {})
+        client = FakeClient([], {})
 
         ProceduresExporter(client, tmp_path / "pros").export()
 
@@ -102,7 +85,7 @@ class TestProceduresExporterEndpoints:
 
 class TestProceduresExporterOutput:
     def test_default_writes_md_only(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: _make_detail(28, "PRO-3")},
         )
@@ -114,7 +97,7 @@ class TestProceduresExporterOutput:
         assert not list((tmp_path / "pros").glob("*.yaml"))
 
     def test_keep_raw_json_writes_json(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: _make_detail(28, "PRO-3")},
         )
@@ -125,7 +108,7 @@ class TestProceduresExporterOutput:
         assert (tmp_path / "pros" / "PRO-3.json").exists()
 
     def test_markdown_has_frontmatter_and_title(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: _make_detail(28, "PRO-3", name=" My Procedure ")},
         )
@@ -140,7 +123,7 @@ class TestProceduresExporterOutput:
         assert "version: '1.0'" in content or 'version: "1.0"' in content
 
     def test_frontmatter_includes_owner_and_approver(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: _make_detail(28, "PRO-3")},
         )
@@ -152,7 +135,7 @@ class TestProceduresExporterOutput:
         assert "approver: John Approver" in content
 
     def test_frontmatter_includes_frequency(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: _make_detail(28, "PRO-3")},
         )
@@ -163,7 +146,7 @@ class TestProceduresExporterOutput:
         assert "frequency: Annual" in content
 
     def test_frontmatter_includes_contributors(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: _make_detail(28, "PRO-3")},
         )
@@ -174,7 +157,7 @@ class TestProceduresExporterOutput:
         assert "Alice Contrib" in content
 
     def test_frontmatter_includes_controls_and_requirements(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: _make_detail(28, "PRO-3")},
             controls={28: _make_controls()},
@@ -190,7 +173,7 @@ class TestProceduresExporterOutput:
         assert "ISO-2" in content
 
     def test_markdown_body_is_converted_from_html(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: _make_detail(28, "PRO-3", html_body="<h3>Section</h3><p>Content.</p>")},
         )
@@ -206,7 +189,7 @@ class TestProceduresExporterOutput:
 
     def test_markdown_lines_are_max_120_chars(self, tmp_path: Path) -> None:
         long_html = "<p>" + ("word " * 70).strip() + "</p>"
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: _make_detail(28, "PRO-3", html_body=long_html)},
         )
@@ -218,7 +201,7 @@ class TestProceduresExporterOutput:
             assert len(line) <= 120
 
     def test_json_includes_all_fields(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: _make_detail(28, "PRO-3")},
             controls={28: _make_controls()},
@@ -227,7 +210,7 @@ class TestProceduresExporterOutput:
 
         ProceduresExporter(client, tmp_path / "pros", keep_raw_json=True).export()
 
-        parsed = json.loads((tmp_path / "pros" / "PRO-3.json").read_text())
+        parsed = json.loads((tmp_path / "pros" / "PRO-3.json").read_bytes())
         assert parsed["code"] == "PRO-3"
         assert parsed["version"] == "1.0"
         assert parsed["owner"] == "Jane Owner"
@@ -240,7 +223,7 @@ class TestProceduresExporterOutput:
 
 class TestProceduresIndex:
     def test_index_created(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: _make_detail(28, "PRO-3", name=" My Procedure ")},
         )
@@ -253,7 +236,7 @@ class TestProceduresIndex:
         assert "My Procedure" in index
 
     def test_index_has_frontmatter(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: _make_detail(28, "PRO-3")},
         )
@@ -266,7 +249,7 @@ class TestProceduresIndex:
         assert "generated:" in index
 
     def test_index_lists_metadata(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: _make_detail(28, "PRO-3")},
         )
@@ -280,7 +263,7 @@ class TestProceduresIndex:
         assert "**Review Date:** 2027-01-26" in index
 
     def test_index_contains_summary_line(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3"), _make_list_item(29, "PRO-5")],
             {
                 28: _make_detail(28, "PRO-3"),
@@ -294,7 +277,7 @@ class TestProceduresIndex:
         assert "2 procedures exported on " in index
 
     def test_index_multiple_documents(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3"), _make_list_item(29, "PRO-5")],
             {
                 28: _make_detail(28, "PRO-3", name=" First "),
@@ -312,7 +295,7 @@ class TestProceduresIndex:
     def test_index_contains_all_codes_as_links(self, tmp_path: Path) -> None:
         items = [_make_list_item(i, f"PRO-{i}") for i in range(1, 4)]
         details = {i: _make_detail(i, f"PRO-{i}") for i in range(1, 4)}
-        client = _setup_client(items, details)
+        client = FakeClient(items, details)
 
         ProceduresExporter(client, tmp_path / "pros").export()
 
@@ -323,7 +306,7 @@ class TestProceduresIndex:
 
 class TestProceduresProgress:
     def test_progress_output(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3"), _make_list_item(29, "PRO-5")],
             {
                 28: _make_detail(28, "PRO-3"),
@@ -340,7 +323,7 @@ class TestProceduresProgress:
         assert "2 documents" in output
 
     def test_empty_list_progress(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
-        client = _setup_client([], {})
+        client = FakeClient([], {})
 
         ProceduresExporter(client, tmp_path / "pros").export()
 
@@ -354,14 +337,14 @@ class TestProceduresEdgeCases:
         detail["approver"] = None
         detail["procedureContributors"] = []
 
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: detail},
         )
 
         ProceduresExporter(client, tmp_path / "pros", keep_raw_json=True).export()
 
-        parsed = json.loads((tmp_path / "pros" / "PRO-3.json").read_text())
+        parsed = json.loads((tmp_path / "pros" / "PRO-3.json").read_bytes())
         assert parsed["owner"] == ""
         assert parsed["approver"] == ""
         assert parsed["contributors"] == []
@@ -371,48 +354,48 @@ class TestProceduresEdgeCases:
         del detail["majorVersion"]
         del detail["minorVersion"]
 
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: detail},
         )
 
         ProceduresExporter(client, tmp_path / "pros", keep_raw_json=True).export()
 
-        parsed = json.loads((tmp_path / "pros" / "PRO-3.json").read_text())
+        parsed = json.loads((tmp_path / "pros" / "PRO-3.json").read_bytes())
         assert parsed["version"] == "0.0"
 
     def test_missing_frequency(self, tmp_path: Path) -> None:
         detail = _make_detail(28, "PRO-3")
         detail["frequency"] = None
 
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: detail},
         )
 
         ProceduresExporter(client, tmp_path / "pros", keep_raw_json=True).export()
 
-        parsed = json.loads((tmp_path / "pros" / "PRO-3.json").read_text())
+        parsed = json.loads((tmp_path / "pros" / "PRO-3.json").read_bytes())
         assert parsed["frequency"] == ""
 
     def test_empty_description(self, tmp_path: Path) -> None:
         detail = _make_detail(28, "PRO-3")
         detail["description"] = ""
 
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: detail},
         )
 
         ProceduresExporter(client, tmp_path / "pros", keep_raw_json=True).export()
 
-        parsed = json.loads((tmp_path / "pros" / "PRO-3.json").read_text())
+        parsed = json.loads((tmp_path / "pros" / "PRO-3.json").read_bytes())
         assert parsed["body_html"] == ""
         assert parsed["body_markdown"] == ""
 
     def test_fallback_filename_without_code(self, tmp_path: Path) -> None:
         detail = _make_detail(28, "", name="Unnamed Procedure")
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "")],
             {28: detail},
         )
@@ -422,7 +405,7 @@ class TestProceduresEdgeCases:
         assert (tmp_path / "pros" / "PRO-28.md").exists()
 
     def test_updated_date_truncated_to_date_only(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: _make_detail(28, "PRO-3")},
         )
@@ -435,7 +418,7 @@ class TestProceduresEdgeCases:
 
 class TestProceduresSingleExport:
     def test_export_single_by_full_code(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             list_items=[_make_list_item(28, "PRO-3"), _make_list_item(29, "PRO-5")],
             details={28: _make_detail(28, "PRO-3")},
             controls={28: _make_controls()},
@@ -449,7 +432,7 @@ class TestProceduresSingleExport:
         assert "# PRO-3 — Test Procedure" in content
 
     def test_export_single_by_numeric_code(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             list_items=[_make_list_item(28, "PRO-3")],
             details={28: _make_detail(28, "PRO-3")},
         )
@@ -459,9 +442,7 @@ class TestProceduresSingleExport:
         assert (tmp_path / "pros" / "PRO-3.md").exists()
 
     def test_export_single_not_found_raises_error(self, tmp_path: Path) -> None:
-        from ctrlmap_cli.exceptions import ItemNotFoundError
-
-        client = _setup_client(
+        client = FakeClient(
             list_items=[_make_list_item(28, "PRO-3")],
             details={},
         )
@@ -470,7 +451,7 @@ class TestProceduresSingleExport:
             ProceduresExporter(client, tmp_path / "pros", force=True).export_single("PRO-99")
 
     def test_export_single_rebuilds_index(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             list_items=[_make_list_item(28, "PRO-3"), _make_list_item(29, "PRO-5")],
             details={28: _make_detail(28, "PRO-3")},
         )
@@ -490,7 +471,7 @@ class TestProceduresSingleExport:
             "status: Draft\nclassification: Public\n---\n# PRO-5\n"
         )
 
-        client = _setup_client(
+        client = FakeClient(
             list_items=[_make_list_item(28, "PRO-3"), _make_list_item(29, "PRO-5")],
             details={28: _make_detail(28, "PRO-3")},
         )
@@ -504,7 +485,7 @@ class TestProceduresSingleExport:
     def test_export_single_progress_output(
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str],
     ) -> None:
-        client = _setup_client(
+        client = FakeClient(
             list_items=[_make_list_item(28, "PRO-3")],
             details={28: _make_detail(28, "PRO-3")},
         )
@@ -522,7 +503,7 @@ class TestProceduresOverwrite:
         pros.mkdir()
         (pros / "PRO-3.md").write_text("old content")
 
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: _make_detail(28, "PRO-3")},
         )
@@ -538,7 +519,7 @@ class TestProceduresOverwrite:
         pros.mkdir()
         (pros / "PRO-3.md").write_text("old content")
 
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: _make_detail(28, "PRO-3")},
         )
@@ -549,7 +530,7 @@ class TestProceduresOverwrite:
         assert (pros / "PRO-3.md").read_text() == "old content"
 
     def test_new_files_written_without_prompt(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: _make_detail(28, "PRO-3")},
         )
@@ -565,7 +546,7 @@ class TestProceduresOverwrite:
         pros.mkdir()
         (pros / "index.md").write_text("old index")
 
-        client = _setup_client(
+        client = FakeClient(
             [_make_list_item(28, "PRO-3")],
             {28: _make_detail(28, "PRO-3")},
         )
@@ -5,6 +5,7 @@ import runpy
 import subprocess
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -19,7 +20,6 @@ def test_version_is_defined() -> None:
 
 
 def test_cli_main_no_args_prints_help(capsys: pytest.CaptureFixture[str]) -> None:
-    from unittest.mock import patch
     with patch("sys.argv", ["ctrlmap-cli"]):
         cli.main()
     captured = capsys.readouterr()
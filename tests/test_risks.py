@@ -7,7 +7,9 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from ctrlmap_cli.exceptions import ItemNotFoundError
 from ctrlmap_cli.exporters.risks import RisksExporter
+from tests.conftest import FakeClient
 
 
 def _make_score(
@@ -102,36 +104,20 @@ def _make_areas() -> List[Dict[str, Any]]:
     return [_make_loss_area()]
 
 
-def _setup_client(
-    list_response: Any = None,
-    detail: Optional[Dict[str, Any]] = None,
-    areas: Optional[List[Dict[str, Any]]] = None,
-) -> MagicMock:
-    client = MagicMock()
-
-    if list_response is None:
-        list_response = {"riskDTOS": []}
-
-    client.list_risks.return_value = list_response
-    client.get_risk.return_value = detail or {}
-    client.get_risk_areas.return_value = areas or []
-    return client
-
-
 class TestRisksExporterEndpoints:
     def test_list_call(self, tmp_path: Path) -> None:
-        client = _setup_client()
+        client = MagicMock(wraps=FakeClient())
 
         RisksExporter(client, tmp_path / "risks").export()
 
         client.list_risks.assert_called_once()
 
     def test_fetches_detail_and_areas_per_risk(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = MagicMock(wraps=FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=_make_detail(32, "RSK-1"),
             areas=_make_areas(),
-        )
+        ))
 
         RisksExporter(client, tmp_path / "risks").export()
 
@@ -139,7 +125,7 @@ class TestRisksExporterEndpoints:
         client.get_risk_areas.assert_called_once_with(32)
 
     def test_empty_list_creates_index_only(self, tmp_path: Path) -> None:
-        client = _setup_client()
+        client = FakeClient()
 
         RisksExporter(client, tmp_path / "risks").export()
 
@@ -148,7 +134,7 @@ class TestRisksExporterEndpoints:
 
     def test_list_as_plain_list(self, tmp_path: Path) -> None:
         """If API returns a plain list instead of {riskDTOS: [...]}, handle it."""
-        client = _setup_client(
+        client = FakeClient(
             list_response=[{"id": 32}],
             detail=_make_detail(32, "RSK-1"),
         )
@@ -160,7 +146,7 @@ class TestRisksExporterEndpoints:
 
 class TestRisksExporterOutput:
     def test_default_writes_md_only(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=_make_detail(32, "RSK-1"),
         )
@@ -171,7 +157,7 @@ class TestRisksExporterOutput:
         assert not (tmp_path / "risks" / "RSK-1.json").exists()
 
     def test_keep_raw_json_writes_json(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=_make_detail(32, "RSK-1"),
         )
@@ -182,7 +168,7 @@ class TestRisksExporterOutput:
         assert (tmp_path / "risks" / "RSK-1.json").exists()
 
     def test_no_yaml_output(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=_make_detail(32, "RSK-1"),
         )
@@ -195,7 +181,7 @@ class TestRisksExporterOutput:
 class TestRisksMarkdownContent:
     def _export_and_read(self, tmp_path: Path, detail: Dict[str, Any],
                          areas: Optional[List[Dict[str, Any]]] = None) -> str:
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": detail["id"]}]},
             detail=detail,
             areas=areas or [],
@@ -348,7 +334,7 @@ class TestRisksTreatmentMapping:
     def test_treatment_mapping(self, state: str, expected: str, tmp_path: Path) -> None:
         detail = _make_detail()
         detail["state"] = state
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=detail,
         )
@@ -359,7 +345,7 @@ class TestRisksTreatmentMapping:
 
 class TestRisksIndex:
     def test_index_created(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=_make_detail(32, "RSK-1", name=" My Risk "),
         )
@@ -372,7 +358,7 @@ class TestRisksIndex:
         assert "My Risk" in index
 
     def test_index_has_frontmatter(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=_make_detail(32, "RSK-1"),
         )
@@ -385,7 +371,7 @@ class TestRisksIndex:
         assert "generated:" in index
 
     def test_index_lists_metadata(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=_make_detail(32, "RSK-1"),
         )
@@ -414,7 +400,7 @@ class TestRisksIndex:
         assert "2 risks exported on " in index
 
     def test_index_singular_noun(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=_make_detail(32, "RSK-1"),
         )
@@ -429,20 +415,20 @@ class TestRisksEdgeCases:
     def test_missing_owner(self, tmp_path: Path) -> None:
         detail = _make_detail()
         detail["userDTO"] = None
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=detail,
         )
 
         RisksExporter(client, tmp_path / "risks", keep_raw_json=True).export()
 
-        parsed = json.loads((tmp_path / "risks" / "RSK-1.json").read_text())
+        parsed = json.loads((tmp_path / "risks" / "RSK-1.json").read_bytes())
         assert parsed["owner"] == ""
 
     def test_missing_status(self, tmp_path: Path) -> None:
         detail = _make_detail()
         detail["status"] = None
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=detail,
         )
@@ -455,7 +441,7 @@ class TestRisksEdgeCases:
     def test_missing_scores(self, tmp_path: Path) -> None:
         detail = _make_detail()
         detail["scoreDetailMap"] = {}
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=detail,
         )
@@ -466,7 +452,7 @@ class TestRisksEdgeCases:
 
     def test_fallback_filename_without_code(self, tmp_path: Path) -> None:
         detail = _make_detail(32, "")
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=detail,
         )
@@ -478,7 +464,7 @@ class TestRisksEdgeCases:
     def test_missing_labels(self, tmp_path: Path) -> None:
         detail = _make_detail()
         detail["systemLabels"] = None
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=detail,
         )
@@ -496,7 +482,7 @@ class TestRisksEdgeCases:
                 "riskLevelDTO": {"id": 3, "title": "Moderate"},
             }],
         )
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=_make_detail(),
             areas=[area],
@@ -514,7 +500,7 @@ class TestRisksEdgeCases:
 
     def test_frontmatter_control_codes_only(self, tmp_path: Path) -> None:
         """Frontmatter controls should be code-only, not code: name."""
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=_make_detail(),
         )
@@ -534,7 +520,7 @@ class TestRisksEdgeCases:
 
 class TestRisksProgress:
     def test_progress_output(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=_make_detail(32, "RSK-1"),
         )
@@ -547,7 +533,7 @@ class TestRisksProgress:
         assert "1 documents" in output
 
     def test_empty_progress(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
-        client = _setup_client()
+        client = FakeClient()
 
         RisksExporter(client, tmp_path / "risks").export()
 
@@ -558,7 +544,7 @@ class TestRisksSingleExport:
     def test_export_single_by_full_code(self, tmp_path: Path) -> None:
         """User passes the riskid code (RSK-1), not the API entity ID."""
         detail = _make_detail(32, "RSK-1")
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}, {"id": 33}]},
             detail=detail,
         )
@@ -571,7 +557,7 @@ class TestRisksSingleExport:
 
     def test_export_single_by_numeric_code(self, tmp_path: Path) -> None:
         """Numeric '1' is treated as RSK-1 (the riskid code)."""
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=_make_detail(32, "RSK-1"),
         )
@@ -581,9 +567,7 @@ class TestRisksSingleExport:
         assert (tmp_path / "risks" / "RSK-1.md").exists()
 
     def test_export_single_not_found_raises_error(self, tmp_path: Path) -> None:
-        from ctrlmap_cli.exceptions import ItemNotFoundError
-
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=_make_detail(32, "RSK-1"),
         )
@@ -593,7 +577,7 @@ class TestRisksSingleExport:
 
     def test_export_single_rebuilds_index(self, tmp_path: Path) -> None:
         """Index is rebuilt from local frontmatter; document_count uses API list."""
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}, {"id": 33}]},
             detail=_make_detail(32, "RSK-1"),
         )
@@ -614,11 +598,10 @@ class TestRisksSingleExport:
             "target_risk:\n  score: 2\n  level: Low\n---\n# RSK-33\n"
         )
 
-        detail1 = _make_detail(32, "RSK-1")
-        client = MagicMock()
-        client.list_risks.return_value = {"riskDTOS": [{"id": 32}, {"id": 33}]}
-        client.get_risk.return_value = detail1
-        client.get_risk_areas.return_value = []
+        client = FakeClient(
+            list_response={"riskDTOS": [{"id": 32}, {"id": 33}]},
+            detail=_make_detail(32, "RSK-1"),
+        )
 
         RisksExporter(client, risks, force=True).export_single("RSK-1")
 
@@ -629,7 +612,7 @@ class TestRisksSingleExport:
     def test_export_single_progress_output(
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str],
     ) -> None:
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=_make_detail(32, "RSK-1"),
         )
@@ -642,7 +625,7 @@ class TestRisksSingleExport:
 
     def test_export_single_with_plain_list(self, tmp_path: Path) -> None:
         """API may return a plain list instead of {riskDTOS: [...]}."""
-        client = _setup_client(
+        client = FakeClient(
             list_response=[{"id": 32}],
             detail=_make_detail(32, "RSK-1"),
         )
@@ -653,11 +636,10 @@ class TestRisksSingleExport:
 
     def test_export_single_code_differs_from_api_id(self, tmp_path: Path) -> None:
         """RSK-66 might have API entity ID 97 — code number != API ID."""
-        detail = _make_detail(97, "RSK-66", name=" Data Breach Risk ")
-        client = MagicMock()
-        client.list_risks.return_value = {"riskDTOS": [{"id": 97}]}
-        client.get_risk.return_value = detail
-        client.get_risk_areas.return_value = []
+        client = FakeClient(
+            list_response={"riskDTOS": [{"id": 97}]},
+            detail=_make_detail(97, "RSK-66", name=" Data Breach Risk "),
+        )
 
         RisksExporter(client, tmp_path / "risks", force=True).export_single("RSK-66")
 
@@ -672,7 +654,7 @@ class TestRisksOverwrite:
         risks.mkdir()
         (risks / "RSK-1.md").write_text("old")
 
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=_make_detail(32, "RSK-1"),
         )
@@ -688,7 +670,7 @@ class TestRisksOverwrite:
         risks.mkdir()
         (risks / "RSK-1.md").write_text("old")
 
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=_make_detail(32, "RSK-1"),
         )
@@ -699,7 +681,7 @@ class TestRisksOverwrite:
         assert (risks / "RSK-1.md").read_text() == "old"
 
     def test_new_files_no_prompt(self, tmp_path: Path) -> None:
-        client = _setup_client(
+        client = FakeClient(
             list_response={"riskDTOS": [{"id": 32}]},
             detail=_make_detail(32, "RSK-1"),
         )
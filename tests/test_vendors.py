@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from ctrlmap_cli.exceptions import ItemNotFoundError
 from ctrlmap_cli.exporters.vendors import (
     VendorsExporter, _as_float, _as_int, _looks_like_markdown, _slugify,
 )
@@ -607,8 +608,6 @@ class TestVendorsSingleExport:
         assert (tmp_path / "vendors" / "VND-17.md").exists()
 
     def test_export_single_not_found_raises_error(self, tmp_path: Path) -> None:
-        from ctrlmap_cli.exceptions import ItemNotFoundError
-
         client = _setup_client(
             list_response=[{"id": 41}],
             detail=_make_detail(),